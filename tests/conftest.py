@@ -0,0 +1,156 @@
+# Copyright 2024 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import os
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator
+
+import pytest
+import pytest_asyncio
+import uvloop
+from pytest_asyncio import is_async_test
+from sqlalchemy import text
+
+from langchain_google_alloydb_pg import AlloyDBEngine
+
+
+def get_env_var(key: str, desc: str) -> str:
+    v = os.environ.get(key)
+    if v is None:
+        raise ValueError(f"Must set env var {key} to: {desc}")
+    return v
+
+
+@dataclass(frozen=True)
+class DbConfig:
+    """Connection settings for the AlloyDB instance under test."""
+
+    project: str
+    region: str
+    cluster: str
+    instance: str
+    database: str
+
+
+# Fixed-size pools for the shared engines: gathered test queries never wait
+# on a cold connect, and no overflow connections are opened and discarded.
+# Connections are recycled before AlloyDB's idle timeout can drop them
+# mid-session.
+TEST_ENGINE_ARGS = {"pool_size": 5, "max_overflow": 0, "pool_recycle": 600}
+
+
+async def _engine_from_config(db_config: DbConfig, **overrides: Any) -> AlloyDBEngine:
+    return await AlloyDBEngine.afrom_instance(
+        project_id=db_config.project,
+        region=db_config.region,
+        cluster=db_config.cluster,
+        instance=db_config.instance,
+        database=db_config.database,
+        engine_args={**TEST_ENGINE_ARGS, **overrides},
+    )
+
+
+async def _awarm_pool(engine: AlloyDBEngine, pool_size: int) -> None:
+    """Opens `pool_size` pooled connections up front."""
+
+    async def ping() -> None:
+        async with engine._pool.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(ping() for _ in range(pool_size)))
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    # Run every async test on the session loop that async fixtures default
+    # to, so engines and their pools are never shared across loops.
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> uvloop.EventLoopPolicy:
+    return uvloop.EventLoopPolicy()
+
+
+@pytest.fixture(scope="session")
+def db_config() -> DbConfig:
+    return DbConfig(
+        project=get_env_var("PROJECT_ID", "project id for google cloud"),
+        region=get_env_var("REGION", "region for AlloyDB instance"),
+        cluster=get_env_var("CLUSTER_ID", "cluster for AlloyDB"),
+        instance=get_env_var("INSTANCE_ID", "instance for AlloyDB"),
+        database=get_env_var("DATABASE_ID", "database name on AlloyDB instance"),
+    )
+
+
+@pytest.fixture(scope="session")
+def default_table_name() -> str:
+    return "test_table_" + uuid.uuid4().hex
+
+
+@pytest.fixture(scope="session")
+def default_sync_table_name() -> str:
+    return "test_table_sync_" + uuid.uuid4().hex
+
+
+@pytest.fixture(scope="session")
+def custom_table_name() -> str:
+    return "test_table_custom_" + uuid.uuid4().hex
+
+
+@pytest.fixture(scope="session")
+def int_id_custom_table_name() -> str:
+    return "test_table_custom_int_id_" + uuid.uuid4().hex
+
+
+@pytest.fixture(scope="class")
+def image_uris() -> Iterator[list[str]]:
+    """Three local image files and one GCS image, for the image store tests."""
+    local_uris = [
+        uuid.uuid4().hex + f"test_image_{color}.jpg"
+        for color in ("red", "green", "blue")
+    ]
+    # FakeImageEmbedding only hashes the path, so the files just need to
+    # exist; their bytes are only stored base64-encoded as row content.
+    for uri in local_uris:
+        with open(uri, "wb") as f:
+            f.write(uri.encode())
+    yield [*local_uris, "gs://github-repo/img/vision/google-cloud-next.jpeg"]
+    for uri in local_uris:
+        os.remove(uri)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_engine(db_config: DbConfig) -> AsyncIterator[AlloyDBEngine]:
+    """Engine shared by tests that only go through the public API and
+    `_run_as_async`, so its pool stays on the engine's background loop."""
+    engine = await _engine_from_config(db_config)
+    await engine._run_as_async(_awarm_pool(engine, TEST_ENGINE_ARGS["pool_size"]))
+    yield engine
+    await engine.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def shared_async_engine(db_config: DbConfig) -> AsyncIterator[AlloyDBEngine]:
+    """Engine shared by tests that use `engine._pool` directly from the
+    session test loop. Keep it separate from `shared_engine`: asyncpg
+    connections are bound to the loop that opened them."""
+    engine = await _engine_from_config(db_config)
+    await _awarm_pool(engine, TEST_ENGINE_ARGS["pool_size"])
+    yield engine
+    await engine.close()
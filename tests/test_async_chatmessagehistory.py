@@ -11,9 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-import os
 import uuid
-from typing import Any, Generator
 
 import pytest
 import pytest_asyncio
@@ -26,45 +24,52 @@ from langchain_google_alloydb_pg.async_chat_message_history import (
     AsyncAlloyDBChatMessageHistory,
 )
 
-project_id = os.environ["PROJECT_ID"]
-region = os.environ["REGION"]
-cluster_id = os.environ["CLUSTER_ID"]
-instance_id = os.environ["INSTANCE_ID"]
-db_name = os.environ["DATABASE_ID"]
 table_name = "message_store" + str(uuid.uuid4())
 table_name_async = "message_store" + str(uuid.uuid4())
 
 
 async def aexecute(engine: AlloyDBEngine, query: str) -> None:
-    async with engine._pool.connect() as conn:
+    async with engine._pool.begin() as conn:
         await conn.execute(text(query))
-        await conn.commit()
 
 
-@pytest_asyncio.fixture
-async def async_engine():
+@pytest.fixture(scope="module")
+def tables_to_drop() -> list[str]:
+    return []
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def async_engine(db_config, tables_to_drop):
     async_engine = await AlloyDBEngine.afrom_instance(
-        project_id=project_id,
-        region=region,
-        cluster=cluster_id,
-        instance=instance_id,
-        database=db_name,
+        project_id=db_config.project,
+        region=db_config.region,
+        cluster=db_config.cluster,
+        instance=db_config.instance,
+        database=db_config.database,
     )
     await async_engine._ainit_chat_history_table(table_name=table_name_async)
+    tables_to_drop.append(table_name_async)
     yield async_engine
-    # use default table for AsyncAlloyDBChatMessageHistory
-    query = f'DROP TABLE IF EXISTS "{table_name_async}"'
-    await aexecute(async_engine, query)
+    names = ", ".join(f'"{table}"' for table in tables_to_drop)
+    await aexecute(async_engine, f"DROP TABLE IF EXISTS {names}")
     await async_engine.close()
 
 
-@pytest.mark.asyncio
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def history(async_engine: AlloyDBEngine) -> AsyncAlloyDBChatMessageHistory:
+    # Validating the table schema costs a round trip, so the tests share one
+    # history; each of them clears its messages before returning.
+    return await AsyncAlloyDBChatMessageHistory.create(
+        engine=async_engine,
+        session_id=str(uuid.uuid4()),
+        table_name=table_name_async,
+    )
+
+
+@pytest.mark.asyncio(loop_scope="session")
 async def test_chat_message_history_async(
-    async_engine: AlloyDBEngine,
+    history: AsyncAlloyDBChatMessageHistory,
 ) -> None:
-    history = await AsyncAlloyDBChatMessageHistory.create(
-        engine=async_engine, session_id="test", table_name=table_name_async
-    )
     msg1 = HumanMessage(content="hi!")
     msg2 = AIMessage(content="whats up?")
     await history.aadd_message(msg1)
@@ -82,15 +87,15 @@ async def test_chat_message_history_async(
     assert len(await history._aget_messages()) == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_chat_message_history_sync_messages(
-    async_engine: AlloyDBEngine,
+    async_engine: AlloyDBEngine, history: AsyncAlloyDBChatMessageHistory
 ) -> None:
-    history1 = await AsyncAlloyDBChatMessageHistory.create(
-        engine=async_engine, session_id="test", table_name=table_name_async
-    )
+    history1 = history
     history2 = await AsyncAlloyDBChatMessageHistory.create(
-        engine=async_engine, session_id="test", table_name=table_name_async
+        engine=async_engine,
+        session_id=history.session_id,
+        table_name=table_name_async,
     )
     msg1 = HumanMessage(content="hi!")
     msg2 = AIMessage(content="whats up?")
@@ -105,7 +110,7 @@ async def test_chat_message_history_sync_messages(
     assert len(await history2._aget_messages()) == 0
 
 
-@pytest.mark.asyncio
+@pytest.mark.asyncio(loop_scope="session")
 async def test_chat_table_async(async_engine):
     with pytest.raises(ValueError):
         await AsyncAlloyDBChatMessageHistory.create(
@@ -113,14 +118,12 @@ async def test_chat_table_async(async_engine):
         )
 
 
-@pytest.mark.asyncio
-async def test_chat_schema_async(async_engine):
+@pytest.mark.asyncio(loop_scope="session")
+async def test_chat_schema_async(async_engine, tables_to_drop):
     table_name = "test_table" + str(uuid.uuid4())
     await async_engine._ainit_document_table(table_name=table_name)
+    tables_to_drop.append(table_name)
     with pytest.raises(IndexError):
         await AsyncAlloyDBChatMessageHistory.create(
             engine=async_engine, session_id="test", table_name=table_name
         )
-
-    query = f'DROP TABLE IF EXISTS "{table_name}"'
-    await aexecute(async_engine, query)
@@ -13,7 +13,6 @@
 # limitations under the License.
 
 import json
-import os
 import uuid
 
 import pytest
@@ -27,32 +26,26 @@ from langchain_google_alloydb_pg.async_loader import (
     AsyncAlloyDBLoader,
 )
 
-project_id = os.environ["PROJECT_ID"]
-region = os.environ["REGION"]
-cluster_id = os.environ["CLUSTER_ID"]
-instance_id = os.environ["INSTANCE_ID"]
-db_name = os.environ["DATABASE_ID"]
 table_name = "test-table" + str(uuid.uuid4())
 
 
-async def aexecute(engine: AlloyDBEngine, query: str) -> None:
-    async with engine._pool.connect() as conn:
-        await conn.execute(text(query))
-        await conn.commit()
+async def aexecute(engine: AlloyDBEngine, *queries: str) -> None:
+    async with engine._pool.begin() as conn:
+        for query in queries:
+            await conn.execute(text(query))
 
 
-@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.asyncio(loop_scope="session")
 class TestLoaderAsync:
 
     @pytest_asyncio.fixture(scope="class")
-    async def engine(self):
-        AlloyDBEngine._connector = None
+    async def engine(self, db_config):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=project_id,
-            cluster=cluster_id,
-            instance=instance_id,
-            region=region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
 
@@ -103,14 +96,13 @@ class TestLoaderAsync:
                     organic INT NOT NULL
                 )
             """
-        await aexecute(engine, query)
 
         insert_query = f"""
             INSERT INTO "{table_name}" (
                 fruit_name, variety, quantity_in_stock, price_per_unit, organic
             ) VALUES ('Apple', 'Granny Smith', 150, 1, 1);
         """
-        await aexecute(engine, insert_query)
+        await aexecute(engine, query, insert_query)
 
         loader = await AsyncAlloyDBLoader.create(
             engine=engine,
@@ -145,7 +137,6 @@ class TestLoaderAsync:
                     organic INT NOT NULL
                 )
             """
-        await aexecute(engine, query)
 
         insert_query = f"""
             INSERT INTO "{table_name}" (fruit_name, variety, quantity_in_stock, price_per_unit, organic)
@@ -153,7 +144,7 @@ class TestLoaderAsync:
                     ('Banana', 'Cavendish', 200, 0.59, 0),
                     ('Orange', 'Navel', 80, 1.29, 1);
         """
-        await aexecute(engine, insert_query)
+        await aexecute(engine, query, insert_query)
 
         loader = await AsyncAlloyDBLoader.create(
             engine=engine,
@@ -199,13 +190,12 @@ class TestLoaderAsync:
                     organic INT NOT NULL
                 )
             """
-        await aexecute(engine, query)
 
         insert_query = f"""
             INSERT INTO "{table_name}" (fruit_name, variety, quantity_in_stock, price_per_unit, organic)
             VALUES ('Apple', 'Granny Smith', 150, 1, 1);
         """
-        await aexecute(engine, insert_query)
+        await aexecute(engine, query, insert_query)
 
         loader = await AsyncAlloyDBLoader.create(
             engine=engine,
@@ -269,7 +259,6 @@ class TestLoaderAsync:
                     organic INT NOT NULL
                 )
             """
-        await aexecute(engine, query)
 
         insert_query = f"""
                     INSERT INTO "{table_name}" (
@@ -280,7 +269,7 @@ class TestLoaderAsync:
                         organic
                     ) VALUES ('Apple', 'Granny Smith', 150, 1, 1);
         """
-        await aexecute(engine, insert_query)
+        await aexecute(engine, query, insert_query)
 
         loader = await AsyncAlloyDBLoader.create(
             engine=engine,
@@ -310,14 +299,13 @@ class TestLoaderAsync:
                 langchain_metadata JSON NOT NULL
             )
             """
-        await aexecute(engine, query)
 
         metadata = json.dumps({"organic": 1})
         insert_query = f"""
             INSERT INTO "{table_name}"
             (fruit_name, variety, quantity_in_stock, price_per_unit, langchain_metadata)
             VALUES ('Apple', 'Granny Smith', 150, 1, '{metadata}');"""
-        await aexecute(engine, insert_query)
+        await aexecute(engine, query, insert_query)
 
         loader = await AsyncAlloyDBLoader.create(
             engine=engine,
@@ -354,7 +342,6 @@ class TestLoaderAsync:
                 langchain_metadata JSON NOT NULL
             )
             """
-        await aexecute(engine, query)
 
         metadata = json.dumps({"organic": 1})
         variety = json.dumps({"type": "Granny Smith"})
@@ -362,7 +349,7 @@ class TestLoaderAsync:
             INSERT INTO "{table_name}"
             (fruit_name, variety, quantity_in_stock, price_per_unit, langchain_metadata)
             VALUES ('Apple', '{variety}', 150, 1, '{metadata}');"""
-        await aexecute(engine, insert_query)
+        await aexecute(engine, query, insert_query)
 
         loader = await AsyncAlloyDBLoader.create(
             engine=engine,
@@ -400,13 +387,12 @@ class TestLoaderAsync:
                     organic INT NOT NULL
                 )
             """
-        await aexecute(engine, query)
 
         insert_query = f"""
                     INSERT INTO "{table_name}" (fruit_name, variety, quantity_in_stock, price_per_unit, organic)
                     VALUES ('Apple', 'Granny Smith', 150, 1, 1);
                     """
-        await aexecute(engine, insert_query)
+        await aexecute(engine, query, insert_query)
 
         def my_formatter(row, content_columns):
             return "-".join(
@@ -452,13 +438,12 @@ class TestLoaderAsync:
                     organic INT NOT NULL
                 )
             """
-        await aexecute(engine, query)
 
         insert_query = f"""
                         INSERT INTO "{table_name}" (fruit_name, variety, quantity_in_stock, price_per_unit, organic)
                         VALUES ('Apple', 'Granny Smith', 150, 1, 1);
                     """
-        await aexecute(engine, insert_query)
+        await aexecute(engine, query, insert_query)
 
         loader = await AsyncAlloyDBLoader.create(
             engine=engine,
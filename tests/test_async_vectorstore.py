@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 import uuid
 from typing import Sequence
 
@@ -20,7 +19,6 @@ import pytest
 import pytest_asyncio
 from langchain_core.documents import Document
 from langchain_core.embeddings import DeterministicFakeEmbedding
-from PIL import Image
 from sqlalchemy import text
 from sqlalchemy.engine.row import RowMapping
 
@@ -53,62 +51,36 @@ class FakeImageEmbedding(DeterministicFakeEmbedding):
 image_embedding_service = FakeImageEmbedding(size=VECTOR_SIZE)
 
 
-def get_env_var(key: str, desc: str) -> str:
-    v = os.environ.get(key)
-    if v is None:
-        raise ValueError(f"Must set env var {key} to: {desc}")
-    return v
-
-
 async def aexecute(engine: AlloyDBEngine, query: str) -> None:
-    async with engine._pool.connect() as conn:
+    async with engine._pool.begin() as conn:
         await conn.execute(text(query))
-        await conn.commit()
 
 
 async def afetch(engine: AlloyDBEngine, query: str) -> Sequence[RowMapping]:
-    async with engine._pool.connect() as conn:
+    autocommit = engine._pool.execution_options(isolation_level="AUTOCOMMIT")
+    async with autocommit.connect() as conn:
         result = await conn.execute(text(query))
         result_map = result.mappings()
         result_fetch = result_map.fetchall()
     return result_fetch
 
 
-@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.asyncio(loop_scope="session")
 class TestVectorStore:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "database name on AlloyDB instance")
-
     @pytest_asyncio.fixture(scope="class")
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
+    async def engine(self, db_config):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            instance=db_instance,
-            cluster=db_cluster,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            instance=db_config.instance,
+            cluster=db_config.cluster,
+            region=db_config.region,
+            database=db_config.database,
         )
 
         yield engine
-        await aexecute(engine, f'DROP TABLE IF EXISTS "{DEFAULT_TABLE}"')
-        await aexecute(engine, f'DROP TABLE IF EXISTS "{CUSTOM_TABLE}"')
+        await aexecute(
+            engine, f'DROP TABLE IF EXISTS "{DEFAULT_TABLE}", "{CUSTOM_TABLE}"'
+        )
         await engine.close()
 
     @pytest_asyncio.fixture(scope="class")
@@ -160,26 +132,6 @@ class TestVectorStore:
         )
         yield vs
 
-    @pytest_asyncio.fixture(scope="class")
-    async def image_uris(self):
-        red_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_red.jpg"
-        green_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_green.jpg"
-        blue_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_blue.jpg"
-        gcs_uri = "gs://github-repo/img/vision/google-cloud-next.jpeg"
-        image = Image.new("RGB", (100, 100), color="red")
-        image.save(red_uri)
-        image = Image.new("RGB", (100, 100), color="green")
-        image.save(green_uri)
-        image = Image.new("RGB", (100, 100), color="blue")
-        image.save(blue_uri)
-        image_uris = [red_uri, green_uri, blue_uri, gcs_uri]
-        yield image_uris
-        for uri in image_uris:
-            try:
-                os.remove(uri)
-            except FileNotFoundError:
-                pass
-
     async def test_init_with_constructor(self, engine):
         with pytest.raises(Exception):
             AsyncAlloyDBVectorStore(
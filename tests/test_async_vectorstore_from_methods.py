@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
+import asyncio
 import uuid
 from typing import Sequence
 
@@ -43,24 +43,15 @@ docs = [
     Document(page_content=texts[i], metadata=metadatas[i]) for i in range(len(texts))
 ]
 
-embeddings = [embeddings_service.embed_query(texts[i]) for i in range(len(texts))]
-
-
-def get_env_var(key: str, desc: str) -> str:
-    v = os.environ.get(key)
-    if v is None:
-        raise ValueError(f"Must set env var {key} to: {desc}")
-    return v
-
 
 async def aexecute(engine: AlloyDBEngine, query: str) -> None:
-    async with engine._pool.connect() as conn:
+    async with engine._pool.begin() as conn:
         await conn.execute(text(query))
-        await conn.commit()
 
 
 async def afetch(engine: AlloyDBEngine, query: str) -> Sequence[RowMapping]:
-    async with engine._pool.connect() as conn:
+    autocommit = engine._pool.execution_options(isolation_level="AUTOCOMMIT")
+    async with autocommit.connect() as conn:
         result = await conn.execute(text(query))
         result_map = result.mappings()
         result_fetch = result_map.fetchall()
@@ -69,60 +60,58 @@ async def afetch(engine: AlloyDBEngine, query: str) -> Sequence[RowMapping]:
 
 @pytest.mark.asyncio
 class TestVectorStoreFromMethods:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "database name on AlloyDB instance")
-
-    @pytest_asyncio.fixture
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
+    @pytest_asyncio.fixture(scope="class")
+    async def engine(self, db_config):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
+        # The first table also creates the vector extension, so only the
+        # remaining tables are created concurrently.
         await engine._ainit_vectorstore_table(DEFAULT_TABLE, VECTOR_SIZE)
-        await engine._ainit_vectorstore_table(
-            CUSTOM_TABLE,
-            VECTOR_SIZE,
-            id_column="myid",
-            content_column="mycontent",
-            embedding_column="myembedding",
-            metadata_columns=[Column("page", "TEXT"), Column("source", "TEXT")],
-            store_metadata=False,
-        )
-        await engine._ainit_vectorstore_table(
-            CUSTOM_TABLE_WITH_INT_ID,
-            VECTOR_SIZE,
-            id_column=Column(name="integer_id", data_type="INTEGER", nullable="False"),
-            content_column="mycontent",
-            embedding_column="myembedding",
-            metadata_columns=[Column("page", "TEXT"), Column("source", "TEXT")],
-            store_metadata=False,
+        await asyncio.gather(
+            engine._ainit_vectorstore_table(
+                CUSTOM_TABLE,
+                VECTOR_SIZE,
+                id_column="myid",
+                content_column="mycontent",
+                embedding_column="myembedding",
+                metadata_columns=[Column("page", "TEXT"), Column("source", "TEXT")],
+                store_metadata=False,
+            ),
+            engine._ainit_vectorstore_table(
+                CUSTOM_TABLE_WITH_INT_ID,
+                VECTOR_SIZE,
+                id_column=Column(
+                    name="integer_id", data_type="INTEGER", nullable="False"
+                ),
+                content_column="mycontent",
+                embedding_column="myembedding",
+                metadata_columns=[Column("page", "TEXT"), Column("source", "TEXT")],
+                store_metadata=False,
+            ),
         )
         yield engine
-        await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE}")
-        await aexecute(engine, f"DROP TABLE IF EXISTS {CUSTOM_TABLE}")
-        await aexecute(engine, f"DROP TABLE IF EXISTS {CUSTOM_TABLE_WITH_INT_ID}")
+        await aexecute(
+            engine,
+            f"DROP TABLE IF EXISTS {DEFAULT_TABLE}, {CUSTOM_TABLE}, "
+            f"{CUSTOM_TABLE_WITH_INT_ID}",
+        )
         await engine.close()
 
+    @pytest_asyncio.fixture(autouse=True)
+    async def truncate_tables(self, engine):
+        # The tables live for the whole class; empty them after every test,
+        # including failed ones, in a single statement.
+        yield
+        await aexecute(
+            engine,
+            f"TRUNCATE TABLE {DEFAULT_TABLE}, {CUSTOM_TABLE}, {CUSTOM_TABLE_WITH_INT_ID}",
+        )
+
     async def test_afrom_texts(self, engine):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
         await AsyncAlloyDBVectorStore.afrom_texts(
@@ -135,7 +124,6 @@ class TestVectorStoreFromMethods:
         )
         results = await afetch(engine, f"SELECT * FROM {DEFAULT_TABLE}")
         assert len(results) == 3
-        await aexecute(engine, f"TRUNCATE TABLE {DEFAULT_TABLE}")
 
     async def test_afrom_docs(self, engine):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
@@ -148,7 +136,6 @@ class TestVectorStoreFromMethods:
         )
         results = await afetch(engine, f"SELECT * FROM {DEFAULT_TABLE}")
         assert len(results) == 3
-        await aexecute(engine, f"TRUNCATE TABLE {DEFAULT_TABLE}")
 
     async def test_afrom_texts_custom(self, engine):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
@@ -197,7 +184,6 @@ class TestVectorStoreFromMethods:
         assert results[0]["myembedding"]
         assert results[0]["page"] == "0"
         assert results[0]["source"] == "google.com"
-        await aexecute(engine, f"TRUNCATE TABLE {CUSTOM_TABLE}")
 
     async def test_afrom_docs_custom_with_int_id(self, engine):
         ids = [i for i in range(len(texts))]
@@ -224,4 +210,3 @@ class TestVectorStoreFromMethods:
         assert len(results) == 3
         for row in results:
             assert isinstance(row["integer_id"], int)
-        await aexecute(engine, f"TRUNCATE TABLE {CUSTOM_TABLE_WITH_INT_ID}")
@@ -13,14 +13,13 @@
 # limitations under the License.
 
 
-import os
-import sys
+import json
 import uuid
 
 import pytest
 import pytest_asyncio
-from langchain_core.documents import Document
 from langchain_core.embeddings import DeterministicFakeEmbedding
+from pgvector.asyncpg import register_vector  # type: ignore[import-untyped]
 from sqlalchemy import text
 
 from langchain_google_alloydb_pg import AlloyDBEngine
@@ -34,63 +33,50 @@ from langchain_google_alloydb_pg.indexes import (
 
 DEFAULT_TABLE = "test_table" + str(uuid.uuid4()).replace("-", "_")
 DEFAULT_INDEX_NAME = DEFAULT_TABLE + DEFAULT_INDEX_NAME_SUFFIX
+SECOND_INDEX_NAME = "secondindex" + str(uuid.uuid4()).replace("-", "_")
 VECTOR_SIZE = 768
 
 embeddings_service = DeterministicFakeEmbedding(size=VECTOR_SIZE)
 
 texts = ["foo", "bar", "baz"]
 ids = [str(uuid.uuid4()) for i in range(len(texts))]
-metadatas = [{"page": str(i), "source": "google.com"} for i in range(len(texts))]
-docs = [
-    Document(page_content=texts[i], metadata=metadatas[i]) for i in range(len(texts))
-]
-
-embeddings = [embeddings_service.embed_query("foo") for i in range(len(texts))]
-
-
-def get_env_var(key: str, desc: str) -> str:
-    v = os.environ.get(key)
-    if v is None:
-        raise ValueError(f"Must set env var {key} to: {desc}")
-    return v
 
 
 async def aexecute(engine: AlloyDBEngine, query: str) -> None:
-    async with engine._pool.connect() as conn:
+    async with engine._pool.begin() as conn:
         await conn.execute(text(query))
-        await conn.commit()
-
-
-@pytest.mark.asyncio(loop_scope="class")
-class TestIndex:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
 
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
 
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
+async def acopy_texts(engine: AlloyDBEngine, table_name: str) -> None:
+    """Bulk-loads `texts` into a vector store table with a single binary COPY."""
+    records = [
+        (id_, text_, embeddings_service.embed_query(text_), json.dumps({}))
+        for id_, text_ in zip(ids, texts)
+    ]
+    async with engine._pool.connect() as conn:
+        raw_conn = (await conn.get_raw_connection()).driver_connection
+        assert raw_conn is not None
+        await register_vector(raw_conn)
+        await raw_conn.copy_records_to_table(
+            table_name,
+            records=records,
+            columns=["langchain_id", "content", "embedding", "langchain_metadata"],
+        )
+        # The vector store expects the default text codecs for vector columns,
+        # so don't hand this connection back to the pool.
+        await conn.invalidate()
 
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "instance for AlloyDB")
 
+@pytest.mark.asyncio(loop_scope="session")
+class TestIndex:
     @pytest_asyncio.fixture(scope="class")
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
+    async def engine(self, db_config):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            instance=db_instance,
-            cluster=db_cluster,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            instance=db_config.instance,
+            cluster=db_config.cluster,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
         await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE}")
@@ -105,8 +91,7 @@ class TestIndex:
             table_name=DEFAULT_TABLE,
         )
 
-        await vs.aadd_texts(texts, ids=ids)
-        await vs.adrop_vector_index()
+        await acopy_texts(engine, DEFAULT_TABLE)
         yield vs
 
     async def test_aapply_vector_index(self, vs):
@@ -115,9 +100,7 @@ class TestIndex:
         assert await vs.is_valid_index(DEFAULT_INDEX_NAME)
 
     async def test_areindex(self, vs):
-        if not await vs.is_valid_index(DEFAULT_INDEX_NAME):
-            index = HNSWIndex()
-            await vs.aapply_vector_index(index)
+        assert await vs.is_valid_index(DEFAULT_INDEX_NAME)
         await vs.areindex()
         await vs.areindex(DEFAULT_INDEX_NAME)
         assert await vs.is_valid_index(DEFAULT_INDEX_NAME)
@@ -132,12 +115,12 @@ class TestIndex:
         await vs.aapply_vector_index(index, concurrently=True)
         assert await vs.is_valid_index(DEFAULT_INDEX_NAME)
         index = IVFFlatIndex(
-            name="secondindex",
+            name=SECOND_INDEX_NAME,
             distance_strategy=DistanceStrategy.INNER_PRODUCT,
         )
         await vs.aapply_vector_index(index)
-        assert await vs.is_valid_index("secondindex")
-        await vs.adrop_vector_index("secondindex")
+        assert await vs.is_valid_index(SECOND_INDEX_NAME)
+        await vs.adrop_vector_index(SECOND_INDEX_NAME)
 
     async def test_is_valid_index(self, vs):
         is_valid = await vs.is_valid_index("invalid_index")
@@ -13,35 +13,22 @@
 # limitations under the License.
 import os
 import uuid
-from typing import Any
+from typing import Any, AsyncIterator
 
 import pytest
 import pytest_asyncio
-import sqlalchemy
 from langchain_core.messages.ai import AIMessage
 from langchain_core.messages.human import HumanMessage
 from sqlalchemy import text
 
 from langchain_google_alloydb_pg import AlloyDBChatMessageHistory, AlloyDBEngine
 
-project_id = os.environ["PROJECT_ID"]
-region = os.environ["REGION"]
-cluster_id = os.environ["CLUSTER_ID"]
-instance_id = os.environ["INSTANCE_ID"]
-db_name = os.environ["DATABASE_ID"]
 table_name = "message_store" + str(uuid.uuid4())
 table_name_async = "message_store" + str(uuid.uuid4())
 user = os.environ["DB_USER"]
 password = os.environ["DB_PASSWORD"]
 
 
-def get_env_var(key: str, desc: str) -> str:
-    v = os.environ.get(key)
-    if v is None:
-        raise ValueError(f"Must set env var {key} to: {desc}")
-    return v
-
-
 async def aexecute(
     engine: AlloyDBEngine,
     query: str,
@@ -54,46 +41,67 @@ async def aexecute(
     await engine._run_as_async(run(engine, query))
 
 
-@pytest_asyncio.fixture
-async def engine():
-    engine = AlloyDBEngine.from_instance(
-        project_id=project_id,
-        region=region,
-        cluster=cluster_id,
-        instance=instance_id,
-        database=db_name,
-    )
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def tables_to_drop(shared_engine: AlloyDBEngine) -> AsyncIterator[list[str]]:
+    # Tables created by this module are dropped together at teardown, in a
+    # single statement, instead of one DROP per fixture or test.
+    tables: list[str] = []
+    yield tables
+    if tables:
+        names = ", ".join(f'"{table}"' for table in tables)
+        await aexecute(shared_engine, f"DROP TABLE IF EXISTS {names}")
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def engine(shared_engine, tables_to_drop):
+    engine = shared_engine
     engine.init_chat_history_table(table_name=table_name)
+    tables_to_drop.append(table_name)
     yield engine
-    # use default table for AlloyDBChatMessageHistory
-    query = f'DROP TABLE IF EXISTS "{table_name}"'
-    await aexecute(engine, query)
-    await engine.close()
 
 
-@pytest_asyncio.fixture
-async def async_engine():
-    async_engine = await AlloyDBEngine.afrom_instance(
-        project_id=project_id,
-        region=region,
-        cluster=cluster_id,
-        instance=instance_id,
-        database=db_name,
-    )
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def async_engine(shared_engine, tables_to_drop):
+    async_engine = shared_engine
     await async_engine.ainit_chat_history_table(table_name=table_name_async)
+    tables_to_drop.append(table_name_async)
     yield async_engine
-    # use default table for AlloyDBChatMessageHistory
-    query = f'DROP TABLE IF EXISTS "{table_name_async}"'
-    await aexecute(async_engine, query)
-    await async_engine.close()
 
 
-def test_chat_message_history(engine: AlloyDBEngine) -> None:
+@pytest.fixture
+def session_id() -> str:
+    return uuid.uuid4().hex
+
+
+@pytest.fixture(scope="module")
+def shared_session_id() -> str:
+    return uuid.uuid4().hex
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def shared_history(
+    async_engine: AlloyDBEngine, shared_session_id: str
+) -> AlloyDBChatMessageHistory:
+    # create() validates the table schema with a round trip, so the async
+    # history tests share one instance instead of re-creating it.
+    return await AlloyDBChatMessageHistory.create(
+        engine=async_engine, session_id=shared_session_id, table_name=table_name_async
+    )
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def history(
+    shared_history: AlloyDBChatMessageHistory,
+) -> AsyncIterator[AlloyDBChatMessageHistory]:
+    yield shared_history
+    await shared_history.aclear()
+
+
+def test_chat_message_history(engine: AlloyDBEngine, session_id: str) -> None:
     history = AlloyDBChatMessageHistory.create_sync(
-        engine=engine, session_id="test", table_name=table_name
+        engine=engine, session_id=session_id, table_name=table_name
     )
-    history.add_user_message("hi!")
-    history.add_ai_message("whats up?")
+    history.add_messages([HumanMessage(content="hi!"), AIMessage(content="whats up?")])
     messages = history.messages
 
     # verify messages are correct
@@ -115,25 +123,20 @@ def test_chat_table(engine: Any) -> None:
 
 
 @pytest.mark.asyncio
-async def test_chat_schema(engine: Any) -> None:
+async def test_chat_schema(engine: Any, tables_to_drop: list[str]) -> None:
     doc_table_name = "test_table" + str(uuid.uuid4())
     engine.init_document_table(table_name=doc_table_name)
+    tables_to_drop.append(doc_table_name)
     with pytest.raises(IndexError):
         AlloyDBChatMessageHistory.create_sync(
             engine=engine, session_id="test", table_name=doc_table_name
         )
 
-    query = f'DROP TABLE IF EXISTS "{doc_table_name}"'
-    await aexecute(engine, query)
-
 
 @pytest.mark.asyncio
 async def test_chat_message_history_async(
-    async_engine: AlloyDBEngine,
+    history: AlloyDBChatMessageHistory,
 ) -> None:
-    history = await AlloyDBChatMessageHistory.create(
-        engine=async_engine, session_id="test", table_name=table_name_async
-    )
     msg1 = HumanMessage(content="hi!")
     msg2 = AIMessage(content="whats up?")
     await history.aadd_message(msg1)
@@ -154,12 +157,13 @@ async def test_chat_message_history_async(
 @pytest.mark.asyncio
 async def test_chat_message_history_sync_messages(
     async_engine: AlloyDBEngine,
+    history: AlloyDBChatMessageHistory,
+    shared_session_id: str,
 ) -> None:
-    history1 = await AlloyDBChatMessageHistory.create(
-        engine=async_engine, session_id="test", table_name=table_name_async
-    )
+    history1 = history
+    # A second instance on the same session must see the first one's writes.
     history2 = await AlloyDBChatMessageHistory.create(
-        engine=async_engine, session_id="test", table_name=table_name_async
+        engine=async_engine, session_id=shared_session_id, table_name=table_name_async
     )
     msg1 = HumanMessage(content="hi!")
     msg2 = AIMessage(content="whats up?")
@@ -183,22 +187,20 @@ async def test_chat_table_async(async_engine):
 
 
 @pytest.mark.asyncio
-async def test_chat_schema_async(async_engine):
+async def test_chat_schema_async(async_engine, tables_to_drop):
     table_name = "test_table" + str(uuid.uuid4())
     await async_engine.ainit_document_table(table_name=table_name)
+    tables_to_drop.append(table_name)
     with pytest.raises(IndexError):
         await AlloyDBChatMessageHistory.create(
             engine=async_engine, session_id="test", table_name=table_name
         )
 
-    query = f'DROP TABLE IF EXISTS "{table_name}"'
-    await aexecute(async_engine, query)
-
 
 @pytest.mark.asyncio
-async def test_cross_env_chat_message_history(engine):
+async def test_cross_env_chat_message_history(engine, session_id):
     history = AlloyDBChatMessageHistory.create_sync(
-        engine=engine, session_id="test_cross", table_name=table_name
+        engine=engine, session_id=session_id, table_name=table_name
     )
     await history.aadd_message(HumanMessage(content="hi!"))
     messages = history.messages
@@ -206,7 +208,7 @@ async def test_cross_env_chat_message_history(engine):
     history.clear()
 
     history = await AlloyDBChatMessageHistory.create(
-        engine=engine, session_id="test_cross", table_name=table_name
+        engine=engine, session_id=session_id, table_name=table_name
     )
     history.add_message(HumanMessage(content="hi!"))
     messages = history.messages
@@ -215,10 +217,10 @@ async def test_cross_env_chat_message_history(engine):
 
 
 @pytest.mark.asyncio
-async def test_from_engine_args_url():
+async def test_from_engine_args_url(db_config):
     host = os.environ["IP_ADDRESS"]
     port = "5432"
-    url = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+    url = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_config.database}"
     engine = AlloyDBEngine.from_engine_args(url)
     table_name = "test_table" + str(uuid.uuid4()).replace("-", "_")
     await engine.ainit_chat_history_table(table_name)
@@ -241,52 +243,3 @@ async def test_from_engine_args_url():
 
     await aexecute(engine, f"DROP TABLE {table_name}")
     await engine.close()
-
-
-@pytest.fixture(scope="module")
-def omni_host() -> str:
-    return get_env_var("OMNI_HOST", "AlloyDB Omni host address")
-
-
-@pytest.fixture(scope="module")
-def omni_user() -> str:
-    return get_env_var("OMNI_USER", "AlloyDB Omni user name")
-
-
-@pytest.fixture(scope="module")
-def omni_password() -> str:
-    return get_env_var("OMNI_PASSWORD", "AlloyDB Omni password")
-
-
-@pytest.fixture(scope="module")
-def omni_database_name() -> str:
-    return get_env_var("OMNI_DATABASE_ID", "AlloyDB Omni database name")
-
-
-@pytest.mark.asyncio
-async def omni_engine(omni_host, omni_user, omni_password, omni_database_name):
-    connstring = f"postgresql+asyncpg://{omni_user}:{omni_password}@{omni_host}:5432/{omni_database_name}"
-    print(f"Connecting to AlloyDB Omni with {connstring}")
-    table_name = "test_table" + str(uuid.uuid4()).replace("-", "_")
-    async_engine = sqlalchemy.ext.asyncio.create_async_engine(connstring)
-    engine = AlloyDBEngine.from_engine(async_engine)
-
-    history = AlloyDBChatMessageHistory.create_sync(
-        engine=engine, session_id="test_cross", table_name=table_name
-    )
-    await history.aadd_message(HumanMessage(content="hi!"))
-    history.add_message(HumanMessage(content="bye!"))
-    assert len(history.messages) == 2
-    await history.aclear()
-
-    history2 = await AlloyDBChatMessageHistory.create(
-        engine=engine, session_id="test_cross", table_name=table_name
-    )
-    await history2.aadd_message(HumanMessage(content="hi!"))
-    history2.add_message(HumanMessage(content="bye!"))
-    assert len(history2.messages) == 2
-    history2.clear()
-
-    await aexecute(engine, f"DROP TABLE {table_name}")
-
-    await engine.close()
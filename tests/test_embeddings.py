@@ -12,73 +12,34 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
-import uuid
-
 import pytest
-import pytest_asyncio
 from langchain_core.documents import Document
 
-from langchain_google_alloydb_pg import AlloyDBEmbeddings, AlloyDBEngine
-
-project_id = os.environ["PROJECT_ID"]
-region = os.environ["REGION"]
-cluster_id = os.environ["CLUSTER_ID"]
-instance_id = os.environ["INSTANCE_ID"]
-db_name = os.environ["DATABASE_ID"]
-table_name = "test-table" + str(uuid.uuid4())
+from langchain_google_alloydb_pg import AlloyDBEmbeddings
 
 
 @pytest.mark.asyncio
 class TestAlloyDBEmbeddings:
 
-    @pytest_asyncio.fixture
-    async def engine(self):
-        AlloyDBEngine._connector = None
-        engine = await AlloyDBEngine.afrom_instance(
-            project_id=project_id,
-            cluster=cluster_id,
-            instance=instance_id,
-            region=region,
-            database=db_name,
-        )
-        yield engine
-
-        await engine.close()
-
-    @pytest_asyncio.fixture
-    async def sync_engine(self):
-        AlloyDBEngine._connector = None
-        engine = AlloyDBEngine.from_instance(
-            project_id=project_id,
-            cluster=cluster_id,
-            instance=instance_id,
-            region=region,
-            database=db_name,
-        )
-        yield engine
-
-        await engine.close()
-
     @pytest.fixture(scope="module")
     def model_id(self) -> str:
         return "textembedding-gecko@001"
 
-    @pytest_asyncio.fixture
-    def embeddings(self, engine, model_id):
-        return AlloyDBEmbeddings.create_sync(engine=engine, model_id=model_id)
+    @pytest.fixture(scope="class")
+    def embeddings(self, shared_engine, model_id):
+        return AlloyDBEmbeddings.create_sync(engine=shared_engine, model_id=model_id)
 
-    async def test_model_exists(self, sync_engine):
+    async def test_model_exists(self, shared_engine):
         test_model_id = "test_sample_text_embedding_model"
         error_message = f"Model {test_model_id} does not exist."
         with pytest.raises(Exception, match=error_message):
-            AlloyDBEmbeddings.create_sync(engine=sync_engine, model_id=test_model_id)
+            AlloyDBEmbeddings.create_sync(engine=shared_engine, model_id=test_model_id)
 
-    async def test_amodel_exists(self, engine):
+    async def test_amodel_exists(self, shared_engine):
         test_model_id = "test_sample_text_embedding_model"
         error_message = f"Model {test_model_id} does not exist."
         with pytest.raises(Exception, match=error_message):
-            await AlloyDBEmbeddings.create(engine=engine, model_id=test_model_id)
+            await AlloyDBEmbeddings.create(engine=shared_engine, model_id=test_model_id)
 
     async def test_aembed_documents(self, embeddings):
         with pytest.raises(NotImplementedError):
@@ -14,7 +14,7 @@
 
 import os
 import uuid
-from typing import Sequence
+from typing import Any, Optional, Sequence
 
 import asyncpg  # type: ignore
 import pytest
@@ -29,19 +29,17 @@ from sqlalchemy.pool import NullPool
 
 from langchain_google_alloydb_pg import AlloyDBEngine, Column
 
-DEFAULT_TABLE = "test_table" + str(uuid.uuid4()).replace("-", "_")
-CUSTOM_TABLE = "test_table_custom" + str(uuid.uuid4()).replace("-", "_")
-INT_ID_CUSTOM_TABLE = "test_table_custom_int_id" + str(uuid.uuid4()).replace("-", "_")
-DEFAULT_TABLE_SYNC = "test_table" + str(uuid.uuid4()).replace("-", "_")
-CUSTOM_TABLE_SYNC = "test_table_custom" + str(uuid.uuid4()).replace("-", "_")
-INT_ID_CUSTOM_TABLE_SYNC = "test_table_custom_int_id" + str(uuid.uuid4()).replace(
-    "-", "_"
-)
 VECTOR_SIZE = 768
 
 embeddings_service = DeterministicFakeEmbedding(size=VECTOR_SIZE)
 host = os.environ["IP_ADDRESS"]
 
+# Bound rather than interpolated, so every lookup reuses one statement.
+COLUMNS_QUERY = (
+    "SELECT column_name, data_type FROM information_schema.columns "
+    "WHERE table_name = :table_name"
+)
+
 
 def get_env_var(key: str, desc: str) -> str:
     v = os.environ.get(key)
@@ -62,10 +60,13 @@ async def aexecute(
     await engine._run_as_async(run(engine, query))
 
 
-async def afetch(engine: AlloyDBEngine, query: str) -> Sequence[RowMapping]:
+async def afetch(
+    engine: AlloyDBEngine, query: str, params: Optional[dict[str, Any]] = None
+) -> Sequence[RowMapping]:
     async def run(engine, query):
-        async with engine._pool.connect() as conn:
-            result = await conn.execute(text(query))
+        autocommit = engine._pool.execution_options(isolation_level="AUTOCOMMIT")
+        async with autocommit.connect() as conn:
+            result = await conn.execute(text(query), params)
             result_map = result.mappings()
             result_fetch = result_map.fetchall()
         return result_fetch
@@ -75,26 +76,6 @@ async def afetch(engine: AlloyDBEngine, query: str) -> Sequence[RowMapping]:
 
 @pytest.mark.asyncio
 class TestEngineAsync:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "instance for AlloyDB")
-
     @pytest.fixture(scope="module")
     def user(self) -> str:
         return get_env_var("DB_USER", "database user for AlloyDB")
@@ -108,13 +89,19 @@ class TestEngineAsync:
         return get_env_var("IAM_ACCOUNT", "Cloud SQL IAM account email")
 
     @pytest_asyncio.fixture(scope="class")
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
+    async def engine(
+        self,
+        db_config,
+        default_table_name,
+        custom_table_name,
+        int_id_custom_table_name,
+    ):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
             engine_args={
                 # add some connection args to validate engine_args works correctly
                 "pool_size": 3,
@@ -122,25 +109,27 @@ class TestEngineAsync:
             },
         )
         yield engine
-        await aexecute(engine, f'DROP TABLE "{CUSTOM_TABLE}"')
-        await aexecute(engine, f'DROP TABLE "{DEFAULT_TABLE}"')
-        await aexecute(engine, f'DROP TABLE "{INT_ID_CUSTOM_TABLE}"')
+        await aexecute(
+            engine,
+            f'DROP TABLE "{custom_table_name}", "{default_table_name}", '
+            f'"{int_id_custom_table_name}"',
+        )
         await engine.close()
 
-    async def test_init_table(self, engine):
-        await engine.ainit_vectorstore_table(DEFAULT_TABLE, VECTOR_SIZE)
+    async def test_init_table(self, engine, default_table_name):
+        await engine.ainit_vectorstore_table(default_table_name, VECTOR_SIZE)
         id = str(uuid.uuid4())
         content = "coffee"
         embedding = await embeddings_service.aembed_query(content)
-        stmt = f"INSERT INTO {DEFAULT_TABLE} (langchain_id, content, embedding) VALUES ('{id}', '{content}','{embedding}');"
+        stmt = f"INSERT INTO {default_table_name} (langchain_id, content, embedding) VALUES ('{id}', '{content}','{embedding}');"
         await aexecute(engine, stmt)
 
     async def test_engine_args(self, engine):
         assert "Pool size: 3" in engine._pool.pool.status()
 
-    async def test_init_table_custom(self, engine):
+    async def test_init_table_custom(self, engine, custom_table_name):
         await engine.ainit_vectorstore_table(
-            CUSTOM_TABLE,
+            custom_table_name,
             VECTOR_SIZE,
             id_column="uuid",
             content_column="my-content",
@@ -148,8 +137,7 @@ class TestEngineAsync:
             metadata_columns=[Column("page", "TEXT"), Column("source", "TEXT")],
             store_metadata=True,
         )
-        stmt = f"SELECT column_name, data_type FROM information_schema.columns WHERE table_name = '{CUSTOM_TABLE}';"
-        results = await afetch(engine, stmt)
+        results = await afetch(engine, COLUMNS_QUERY, {"table_name": custom_table_name})
         expected = [
             {"column_name": "uuid", "data_type": "uuid"},
             {"column_name": "my_embedding", "data_type": "USER-DEFINED"},
@@ -161,9 +149,9 @@ class TestEngineAsync:
         for row in results:
             assert row in expected
 
-    async def test_init_table_with_int_id(self, engine):
+    async def test_init_table_with_int_id(self, engine, int_id_custom_table_name):
         await engine.ainit_vectorstore_table(
-            INT_ID_CUSTOM_TABLE,
+            int_id_custom_table_name,
             VECTOR_SIZE,
             id_column=Column(name="integer_id", data_type="INTEGER", nullable="False"),
             content_column="my-content",
@@ -171,8 +159,9 @@ class TestEngineAsync:
             metadata_columns=[Column("page", "TEXT"), Column("source", "TEXT")],
             store_metadata=True,
         )
-        stmt = f"SELECT column_name, data_type FROM information_schema.columns WHERE table_name = '{INT_ID_CUSTOM_TABLE}';"
-        results = await afetch(engine, stmt)
+        results = await afetch(
+            engine, COLUMNS_QUERY, {"table_name": int_id_custom_table_name}
+        )
         expected = [
             {"column_name": "integer_id", "data_type": "integer"},
             {"column_name": "my_embedding", "data_type": "USER-DEFINED"},
@@ -186,21 +175,17 @@ class TestEngineAsync:
 
     async def test_password(
         self,
-        db_project,
-        db_region,
-        db_cluster,
-        db_instance,
-        db_name,
+        db_config,
         user,
         password,
     ):
         AlloyDBEngine._connector = None
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            instance=db_instance,
-            region=db_region,
-            cluster=db_cluster,
-            database=db_name,
+            project_id=db_config.project,
+            instance=db_config.instance,
+            region=db_config.region,
+            cluster=db_config.cluster,
+            database=db_config.database,
             user=user,
             password=password,
         )
@@ -211,11 +196,7 @@ class TestEngineAsync:
 
     async def test_from_engine(
         self,
-        db_project,
-        db_region,
-        db_cluster,
-        db_instance,
-        db_name,
+        db_config,
         user,
         password,
     ):
@@ -223,11 +204,12 @@ class TestEngineAsync:
 
             async def getconn() -> asyncpg.Connection:
                 conn = await connector.connect(  # type: ignore
-                    f"projects/{db_project}/locations/{db_region}/clusters/{db_cluster}/instances/{db_instance}",
+                    f"projects/{db_config.project}/locations/{db_config.region}"
+                    f"/clusters/{db_config.cluster}/instances/{db_config.instance}",
                     "asyncpg",
                     user=user,
                     password=password,
-                    db=db_name,
+                    db=db_config.database,
                     enable_iam_auth=False,
                     ip_type=IPTypes.PUBLIC,
                 )
@@ -244,12 +226,14 @@ class TestEngineAsync:
 
     async def test_from_engine_args_url(
         self,
-        db_name,
+        db_config,
         user,
         password,
     ):
         port = "5432"
-        url = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+        url = (
+            f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_config.database}"
+        )
         engine = AlloyDBEngine.from_engine_args(
             url,
             echo=True,
@@ -259,28 +243,34 @@ class TestEngineAsync:
         await engine.close()
 
         engine = AlloyDBEngine.from_engine_args(
-            URL.create("postgresql+asyncpg", user, password, host, port, db_name)
+            URL.create(
+                "postgresql+asyncpg", user, password, host, port, db_config.database
+            )
         )
         await aexecute(engine, "SELECT 1")
         await engine.close()
 
     async def test_from_engine_args_url_error(
         self,
-        db_name,
+        db_config,
         user,
         password,
     ):
         port = "5432"
-        url = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+        url = (
+            f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_config.database}"
+        )
         with pytest.raises(TypeError):
             engine = AlloyDBEngine.from_engine_args(url, random=False)
         with pytest.raises(ValueError):
             AlloyDBEngine.from_engine_args(
-                f"postgresql+pg8000://{user}:{password}@{host}:{port}/{db_name}",
+                f"postgresql+pg8000://{user}:{password}@{host}:{port}/{db_config.database}",
             )
         with pytest.raises(ValueError):
             AlloyDBEngine.from_engine_args(
-                URL.create("postgresql+pg8000", user, password, host, port, db_name)
+                URL.create(
+                    "postgresql+pg8000", user, password, host, port, db_config.database
+                )
             )
 
     async def test_column(self, engine):
@@ -291,19 +281,15 @@ class TestEngineAsync:
 
     async def test_iam_account_override(
         self,
-        db_project,
-        db_cluster,
-        db_instance,
-        db_region,
-        db_name,
+        db_config,
         iam_account,
     ):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
             iam_account_email=iam_account,
         )
         assert engine
@@ -313,131 +299,34 @@ class TestEngineAsync:
 
 @pytest.mark.asyncio
 class TestEngineSync:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
+    """Smoke tests for the sync wrappers.
 
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def user(self) -> str:
-        return get_env_var("DB_USER", "database user for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def password(self) -> str:
-        return get_env_var("DB_PASSWORD", "database password for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def iam_account(self) -> str:
-        return get_env_var("IAM_ACCOUNT", "Cloud SQL IAM account email")
+    The sync methods dispatch to the same coroutines covered by
+    TestEngineAsync, so only the wrapper itself is exercised here.
+    """
 
     @pytest_asyncio.fixture(scope="class")
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
+    async def engine(
+        self,
+        db_config,
+        default_sync_table_name,
+    ):
         engine = AlloyDBEngine.from_instance(
-            project_id=db_project,
-            instance=db_instance,
-            cluster=db_cluster,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            instance=db_config.instance,
+            cluster=db_config.cluster,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
-        await aexecute(engine, f'DROP TABLE "{CUSTOM_TABLE_SYNC}"')
-        await aexecute(engine, f'DROP TABLE "{DEFAULT_TABLE_SYNC}"')
-        await aexecute(engine, f'DROP TABLE "{INT_ID_CUSTOM_TABLE_SYNC}"')
+        await aexecute(engine, f'DROP TABLE IF EXISTS "{default_sync_table_name}"')
         await engine.close()
 
-    async def test_init_table(self, engine):
-        engine.init_vectorstore_table(DEFAULT_TABLE_SYNC, VECTOR_SIZE)
-        id = str(uuid.uuid4())
-        content = "coffee"
-        embedding = await embeddings_service.aembed_query(content)
-        stmt = f"INSERT INTO {DEFAULT_TABLE_SYNC} (langchain_id, content, embedding) VALUES ('{id}', '{content}','{embedding}');"
-        await aexecute(engine, stmt)
-
-    async def test_init_table_custom(self, engine):
-        engine.init_vectorstore_table(
-            CUSTOM_TABLE_SYNC,
-            VECTOR_SIZE,
-            id_column="uuid",
-            content_column="my-content",
-            embedding_column="my_embedding",
-            metadata_columns=[Column("page", "TEXT"), Column("source", "TEXT")],
-            store_metadata=True,
-        )
-        stmt = f"SELECT column_name, data_type FROM information_schema.columns WHERE table_name = '{CUSTOM_TABLE_SYNC}';"
-        results = await afetch(engine, stmt)
-        expected = [
-            {"column_name": "uuid", "data_type": "uuid"},
-            {"column_name": "my_embedding", "data_type": "USER-DEFINED"},
-            {"column_name": "langchain_metadata", "data_type": "json"},
-            {"column_name": "my-content", "data_type": "text"},
-            {"column_name": "page", "data_type": "text"},
-            {"column_name": "source", "data_type": "text"},
-        ]
-        for row in results:
-            assert row in expected
-
-    async def test_init_table_with_int_id(self, engine):
-        engine.init_vectorstore_table(
-            INT_ID_CUSTOM_TABLE_SYNC,
-            VECTOR_SIZE,
-            id_column=Column(name="integer_id", data_type="INTEGER", nullable="False"),
-            content_column="my-content",
-            embedding_column="my_embedding",
-            metadata_columns=[Column("page", "TEXT"), Column("source", "TEXT")],
-            store_metadata=True,
-        )
-        stmt = f"SELECT column_name, data_type FROM information_schema.columns WHERE table_name = '{INT_ID_CUSTOM_TABLE_SYNC}';"
+    async def test_init_table_smoke(self, engine, default_sync_table_name):
+        engine.init_vectorstore_table(default_sync_table_name, VECTOR_SIZE)
+        stmt = f'SELECT * FROM "{default_sync_table_name}";'
         results = await afetch(engine, stmt)
-        expected = [
-            {"column_name": "integer_id", "data_type": "integer"},
-            {"column_name": "my_embedding", "data_type": "USER-DEFINED"},
-            {"column_name": "langchain_metadata", "data_type": "json"},
-            {"column_name": "my-content", "data_type": "text"},
-            {"column_name": "page", "data_type": "text"},
-            {"column_name": "source", "data_type": "text"},
-        ]
-        for row in results:
-            assert row in expected
-
-    async def test_password(
-        self,
-        db_project,
-        db_region,
-        db_cluster,
-        db_instance,
-        db_name,
-        user,
-        password,
-    ):
-        AlloyDBEngine._connector = None
-        engine = AlloyDBEngine.from_instance(
-            project_id=db_project,
-            instance=db_instance,
-            region=db_region,
-            cluster=db_cluster,
-            database=db_name,
-            user=user,
-            password=password,
-        )
-        assert engine
-        await aexecute(engine, "SELECT 1")
-        AlloyDBEngine._connector = None
-        await engine.close()
+        assert len(results) == 0
 
     async def test_engine_constructor_key(
         self,
@@ -446,24 +335,3 @@ class TestEngineSync:
         key = object()
         with pytest.raises(Exception):
             AlloyDBEngine(key, engine)
-
-    async def test_iam_account_override(
-        self,
-        db_project,
-        db_cluster,
-        db_instance,
-        db_region,
-        db_name,
-        iam_account,
-    ):
-        engine = AlloyDBEngine.from_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
-            iam_account_email=iam_account,
-        )
-        assert engine
-        await aexecute(engine, "SELECT 1")
-        await engine.close()
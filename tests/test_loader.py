@@ -13,13 +13,13 @@
 # limitations under the License.
 
 import json
-import os
 import uuid
+from typing import Any, Optional, Union
 
 import pytest
 import pytest_asyncio
 from langchain_core.documents import Document
-from sqlalchemy import text
+from sqlalchemy import TextClause, text
 
 from langchain_google_alloydb_pg import (
     AlloyDBDocumentSaver,
@@ -28,13 +28,6 @@ from langchain_google_alloydb_pg import (
     Column,
 )
 
-project_id = os.environ["PROJECT_ID"]
-region = os.environ["REGION"]
-cluster_id = os.environ["CLUSTER_ID"]
-instance_id = os.environ["INSTANCE_ID"]
-db_name = os.environ["DATABASE_ID"]
-table_name = "test-table" + str(uuid.uuid4())
-
 
 async def aexecute(
     engine: AlloyDBEngine,
@@ -48,36 +41,231 @@ async def aexecute(
     await engine._run_as_async(run(engine, query))
 
 
-@pytest.mark.asyncio
+def dash_formatter(row, content_columns):
+    return "-".join(str(row[column]) for column in content_columns if column in row)
+
+
+Query = Union[str, TextClause]
+
+FRUIT_INSERT = """
+    INSERT INTO "{table_name}" (
+        fruit_name,
+        variety,
+        quantity_in_stock,
+        price_per_unit,
+        organic,
+        langchain_metadata
+    ) VALUES (
+        :fruit_name,
+        :variety,
+        :quantity_in_stock,
+        :price_per_unit,
+        :organic,
+        :langchain_metadata
+    );
+"""
+
+
+def fruit(
+    fruit_name: str,
+    variety: str,
+    quantity_in_stock: int,
+    price_per_unit: int,
+    organic: int,
+    langchain_metadata: Optional[dict] = None,
+) -> dict[str, Any]:
+    return {
+        "fruit_name": fruit_name,
+        "variety": variety,
+        "quantity_in_stock": quantity_in_stock,
+        "price_per_unit": price_per_unit,
+        "organic": organic,
+        "langchain_metadata": (
+            json.dumps(langchain_metadata) if langchain_metadata else None
+        ),
+    }
+
+
+APPLE = [fruit("Apple", "Granny Smith", 150, 1, 1)]
+APPLE_DOCUMENT = Document(
+    page_content="1",
+    metadata={
+        "fruit_name": "Apple",
+        "variety": "Granny Smith",
+        "quantity_in_stock": 150,
+        "price_per_unit": 1,
+        "organic": 1,
+    },
+)
+APPLE_METADATA = {"fruit_id": 1, "fruit_name": "Apple", "organic": 1}
+VARIETY_CONTENT = ["variety", "quantity_in_stock", "price_per_unit"]
+
+LOAD_FROM_QUERY_CASES = [
+    pytest.param(
+        APPLE,
+        {},
+        [APPLE_DOCUMENT],
+        id="default",
+    ),
+    pytest.param(
+        [
+            fruit("Apple", "Granny Smith", 150, 1, 1),
+            fruit("Banana", "Cavendish", 200, 1, 0),
+            fruit("Orange", "Navel", 80, 1, 1),
+        ],
+        {
+            "content_columns": [
+                "fruit_name",
+                "variety",
+                "quantity_in_stock",
+                "price_per_unit",
+                "organic",
+            ],
+            "metadata_columns": ["fruit_id"],
+        },
+        [
+            Document(
+                page_content="Apple Granny Smith 150 1 1",
+                metadata={"fruit_id": 1},
+            ),
+            Document(
+                page_content="Banana Cavendish 200 1 0",
+                metadata={"fruit_id": 2},
+            ),
+            Document(
+                page_content="Orange Navel 80 1 1",
+                metadata={"fruit_id": 3},
+            ),
+        ],
+        id="customized_content_customized_metadata",
+    ),
+    pytest.param(
+        APPLE,
+        {"content_columns": VARIETY_CONTENT},
+        [Document(page_content="Granny Smith 150 1", metadata=APPLE_METADATA)],
+        id="customized_content_default_metadata",
+    ),
+    pytest.param(
+        APPLE,
+        {"content_columns": VARIETY_CONTENT, "format": "JSON"},
+        [
+            Document(
+                page_content='{"variety": "Granny Smith", "quantity_in_stock": 150, "price_per_unit": 1}',
+                metadata=APPLE_METADATA,
+            )
+        ],
+        id="customized_content_default_metadata_json",
+    ),
+    pytest.param(
+        APPLE,
+        {"metadata_columns": ["fruit_name", "organic"]},
+        [Document(page_content="1", metadata={"fruit_name": "Apple", "organic": 1})],
+        id="default_content_customized_metadata",
+    ),
+    pytest.param(
+        APPLE,
+        {"content_columns": VARIETY_CONTENT, "formatter": dash_formatter},
+        [Document(page_content="Granny Smith-150-1", metadata=APPLE_METADATA)],
+        id="custom_formatter",
+    ),
+    pytest.param(
+        APPLE,
+        {"content_columns": VARIETY_CONTENT, "format": "YAML"},
+        [
+            Document(
+                page_content="variety: Granny Smith\nquantity_in_stock: 150\nprice_per_unit: 1",
+                metadata=APPLE_METADATA,
+            )
+        ],
+        id="custom_page_content_format",
+    ),
+]
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestLoaderAsync:
-    @pytest_asyncio.fixture
-    async def engine(self):
-        AlloyDBEngine._connector = None
+    @pytest_asyncio.fixture(scope="class")
+    async def engine(self, db_config):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=project_id,
-            cluster=cluster_id,
-            instance=instance_id,
-            region=region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
 
         await engine.close()
 
-    @pytest_asyncio.fixture
-    async def sync_engine(self):
-        AlloyDBEngine._connector = None
+    @pytest_asyncio.fixture(loop_scope="session")
+    async def sync_engine(self, db_config):
         engine = AlloyDBEngine.from_instance(
-            project_id=project_id,
-            cluster=cluster_id,
-            instance=instance_id,
-            region=region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
 
         await engine.close()
 
+    @pytest_asyncio.fixture(loop_scope="session")
+    async def table_name(self, engine):
+        table_name = "test_table_" + uuid.uuid4().hex
+        yield table_name
+        await aexecute(engine, f'DROP TABLE IF EXISTS "{table_name}"')
+
+    @pytest_asyncio.fixture(scope="class")
+    async def fruit_table(self, engine):
+        fruit_table = "test_table_" + uuid.uuid4().hex
+        query = f"""
+            CREATE TABLE "{fruit_table}" (
+                fruit_id SERIAL PRIMARY KEY,
+                fruit_name VARCHAR(100) NOT NULL,
+                variety VARCHAR(50),
+                quantity_in_stock INT NOT NULL,
+                price_per_unit INT NOT NULL,
+                organic INT NOT NULL,
+                langchain_metadata JSON
+            )
+        """
+        await aexecute(engine, query)
+        yield fruit_table
+        await aexecute(engine, f'DROP TABLE IF EXISTS "{fruit_table}"')
+
+    @pytest.fixture(scope="class")
+    def fruit_table_reset(self, fruit_table: str) -> tuple[TextClause, TextClause]:
+        """TRUNCATE and INSERT statements for the shared fruit table."""
+        return (
+            text(f'TRUNCATE TABLE "{fruit_table}" RESTART IDENTITY'),
+            text(FRUIT_INSERT.format(table_name=fruit_table)),
+        )
+
+    async def _setup(
+        self,
+        engine: AlloyDBEngine,
+        *statements: Union[Query, tuple[Query, Union[dict, list[dict]]]],
+    ) -> None:
+        """Runs table setup statements on one connection with a single commit.
+
+        Each statement is either a query or a (query, parameters) pair, where a
+        list of parameter dicts is executed as one batched executemany.
+        """
+
+        async def run(engine, statements):
+            async with engine._pool.connect() as conn:
+                for statement in statements:
+                    query, params = (
+                        statement if isinstance(statement, tuple) else (statement, None)
+                    )
+                    if isinstance(query, str):
+                        query = text(query)
+                    await conn.execute(query, params)
+                await conn.commit()
+
+        await engine._run_as_async(run(engine, statements))
+
     async def _collect_async_items(self, docs_generator):
         """Collects items from an async generator."""
         docs = []
@@ -85,11 +273,7 @@ class TestLoaderAsync:
             docs.append(doc)
         return docs
 
-    async def _cleanup_table(self, engine):
-        query = f'DROP TABLE IF EXISTS "{table_name}"'
-        await aexecute(engine, query)
-
-    async def test_create_loader_with_invalid_parameters(self, engine):
+    async def test_create_loader_with_invalid_parameters(self, engine, table_name):
         with pytest.raises(ValueError):
             await AlloyDBLoader.create(
                 engine=engine,
@@ -112,462 +296,127 @@ class TestLoaderAsync:
                 format="fake_format",
             )
 
-    async def test_load_from_query_default(self, engine):
-        try:
-            await self._cleanup_table(engine)
-            query = f"""
-                    CREATE TABLE IF NOT EXISTS "{table_name}" (
-                        fruit_id SERIAL PRIMARY KEY,
-                        fruit_name VARCHAR(100) NOT NULL,
-                        variety VARCHAR(50),
-                        quantity_in_stock INT NOT NULL,
-                        price_per_unit INT NOT NULL,
-                        organic INT NOT NULL
-                    )
-                """
-            await aexecute(engine, query)
-
-            insert_query = f"""
-                INSERT INTO "{table_name}" (
-                    fruit_name, variety, quantity_in_stock, price_per_unit, organic
-                ) VALUES ('Apple', 'Granny Smith', 150, 1, 1);
-            """
-            await aexecute(engine, insert_query)
-
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                query=f'SELECT * FROM "{table_name}";',
-                table_name=table_name,
-            )
-
-            documents = await self._collect_async_items(loader.alazy_load())
-
-            assert documents == [
-                Document(
-                    page_content="1",
-                    metadata={
-                        "fruit_name": "Apple",
-                        "variety": "Granny Smith",
-                        "quantity_in_stock": 150,
-                        "price_per_unit": 1,
-                        "organic": 1,
-                    },
-                )
-            ]
-        except Exception as e:
-            print(e)
-        finally:
-            await self._cleanup_table(engine)
-
-    async def test_load_from_query_customized_content_customized_metadata(self, engine):
-        try:
-            await self._cleanup_table(engine)
-            query = f"""
-                    CREATE TABLE IF NOT EXISTS "{table_name}" (
-                        fruit_id SERIAL PRIMARY KEY,
-                        fruit_name VARCHAR(100) NOT NULL,
-                        variety VARCHAR(50),
-                        quantity_in_stock INT NOT NULL,
-                        price_per_unit INT NOT NULL,
-                        organic INT NOT NULL
-                    )
-                """
-            await aexecute(engine, query)
-
-            insert_query = f"""
-                INSERT INTO "{table_name}" (fruit_name, variety, quantity_in_stock, price_per_unit, organic)
-                VALUES ('Apple', 'Granny Smith', 150, 0.99, 1),
-                       ('Banana', 'Cavendish', 200, 0.59, 0),
-                       ('Orange', 'Navel', 80, 1.29, 1);
-            """
-            await aexecute(engine, insert_query)
-
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                query=f'SELECT * FROM "{table_name}";',
-                content_columns=[
-                    "fruit_name",
-                    "variety",
-                    "quantity_in_stock",
-                    "price_per_unit",
-                    "organic",
-                ],
-                metadata_columns=["fruit_id"],
-            )
-
-            documents = await self._collect_async_items(loader.alazy_load())
-
-            assert documents == [
-                Document(
-                    page_content="Apple Granny Smith 150 1 1",
-                    metadata={"fruit_id": 1},
-                ),
-                Document(
-                    page_content="Banana Cavendish 200 1 0",
-                    metadata={"fruit_id": 2},
-                ),
-                Document(
-                    page_content="Orange Navel 80 1 1",
-                    metadata={"fruit_id": 3},
-                ),
-            ]
-
-        finally:
-            await self._cleanup_table(engine)
-
-    async def test_load_from_query_customized_content_default_metadata(self, engine):
-        try:
-            await self._cleanup_table(engine)
-            query = f"""
-                    CREATE TABLE IF NOT EXISTS "{table_name}" (
-                        fruit_id SERIAL PRIMARY KEY,
-                        fruit_name VARCHAR(100) NOT NULL,
-                        variety VARCHAR(50),
-                        quantity_in_stock INT NOT NULL,
-                        price_per_unit INT NOT NULL,
-                        organic INT NOT NULL
-                    )
-                """
-            await aexecute(engine, query)
-
-            insert_query = f"""
-                INSERT INTO "{table_name}" (fruit_name, variety, quantity_in_stock, price_per_unit, organic)
-                VALUES ('Apple', 'Granny Smith', 150, 1, 1);
-            """
-            await aexecute(engine, insert_query)
-
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                query=f'SELECT * FROM "{table_name}";',
-                content_columns=[
-                    "variety",
-                    "quantity_in_stock",
-                    "price_per_unit",
-                ],
-            )
-
-            documents = []
-            for docs in loader.lazy_load():
-                documents.append(docs)
-
-            assert documents == [
-                Document(
-                    page_content="Granny Smith 150 1",
-                    metadata={
-                        "fruit_id": 1,
-                        "fruit_name": "Apple",
-                        "organic": 1,
-                    },
-                )
-            ]
-
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                query=f'SELECT * FROM "{table_name}";',
-                content_columns=[
-                    "variety",
-                    "quantity_in_stock",
-                    "price_per_unit",
-                ],
-                format="JSON",
-            )
-
-            documents = await self._collect_async_items(loader.alazy_load())
-
-            assert documents == [
-                Document(
-                    page_content='{"variety": "Granny Smith", "quantity_in_stock": 150, "price_per_unit": 1}',
-                    metadata={
-                        "fruit_id": 1,
-                        "fruit_name": "Apple",
-                        "organic": 1,
-                    },
-                )
-            ]
-
-        finally:
-            await self._cleanup_table(engine)
-
-    async def test_load_from_query_default_content_customized_metadata(self, engine):
-        try:
-            await self._cleanup_table(engine)
-            query = f"""
-                    CREATE TABLE IF NOT EXISTS "{table_name}" (
-                        fruit_id SERIAL PRIMARY KEY,
-                        fruit_name VARCHAR(100) NOT NULL,
-                        variety VARCHAR(50),
-                        quantity_in_stock INT NOT NULL,
-                        price_per_unit INT NOT NULL,
-                        organic INT NOT NULL
-                    )
-                """
-            await aexecute(engine, query)
-
-            insert_query = f"""
-                        INSERT INTO "{table_name}" (
-                            fruit_name,
-                            variety,
-                            quantity_in_stock,
-                            price_per_unit,
-                            organic
-                        ) VALUES ('Apple', 'Granny Smith', 150, 1, 1);
-            """
-            await aexecute(engine, insert_query)
-
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                query=f'SELECT * FROM "{table_name}";',
-                metadata_columns=["fruit_name", "organic"],
-            )
-
-            documents = await self._collect_async_items(loader.alazy_load())
-
-            assert documents == [
-                Document(
-                    page_content="1",
-                    metadata={"fruit_name": "Apple", "organic": 1},
-                )
-            ]
-
-        finally:
-            await self._cleanup_table(engine)
-
-    async def test_load_from_query_with_langchain_metadata(self, engine):
-        try:
-            await self._cleanup_table(engine)
-            query = f"""
-                CREATE TABLE IF NOT EXISTS "{table_name}"(
-                    fruit_id SERIAL PRIMARY KEY,
-                    fruit_name VARCHAR(100) NOT NULL,
-                    variety VARCHAR(50),
-                    quantity_in_stock INT NOT NULL,
-                    price_per_unit INT NOT NULL,
-                    langchain_metadata JSON NOT NULL
-                )
-                """
-            await aexecute(engine, query)
-
-            metadata = json.dumps({"organic": 1})
-            insert_query = f"""
-                INSERT INTO "{table_name}"
-                (fruit_name, variety, quantity_in_stock, price_per_unit, langchain_metadata)
-                VALUES ('Apple', 'Granny Smith', 150, 1, '{metadata}');"""
-            await aexecute(engine, insert_query)
-
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                query=f'SELECT * FROM "{table_name}";',
-                metadata_columns=[
-                    "fruit_name",
-                    "langchain_metadata",
-                ],
-            )
-
-            documents = await self._collect_async_items(loader.alazy_load())
+    @pytest.mark.parametrize("rows,loader_kwargs,expected", LOAD_FROM_QUERY_CASES)
+    async def test_load_from_query(
+        self, engine, fruit_table, fruit_table_reset, rows, loader_kwargs, expected
+    ):
+        truncate, insert = fruit_table_reset
+        await self._setup(engine, truncate, (insert, rows))
 
-            assert documents == [
-                Document(
-                    page_content="1",
-                    metadata={
-                        "fruit_name": "Apple",
-                        "organic": 1,
-                    },
-                )
-            ]
+        loader = await AlloyDBLoader.create(
+            engine=engine,
+            query=f'SELECT * FROM "{fruit_table}";',
+            **loader_kwargs,
+        )
 
-        finally:
-            await self._cleanup_table(engine)
-
-    async def test_load_from_query_with_json(self, engine):
-        try:
-            await self._cleanup_table(engine)
-            query = f"""
-                CREATE TABLE IF NOT EXISTS "{table_name}"(
-                    fruit_id SERIAL PRIMARY KEY,
-                    fruit_name VARCHAR(100) NOT NULL,
-                    variety JSON NOT NULL,
-                    quantity_in_stock INT NOT NULL,
-                    price_per_unit INT NOT NULL,
-                    langchain_metadata JSON NOT NULL
-                )
-                """
-            await aexecute(engine, query)
-
-            metadata = json.dumps({"organic": 1})
-            variety = json.dumps({"type": "Granny Smith"})
-            insert_query = f"""
-                INSERT INTO "{table_name}"
-                (fruit_name, variety, quantity_in_stock, price_per_unit, langchain_metadata)
-                VALUES ('Apple', '{variety}', 150, 1, '{metadata}');"""
-            await aexecute(engine, insert_query)
-
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                query=f'SELECT * FROM "{table_name}";',
-                metadata_columns=[
-                    "variety",
-                ],
-            )
+        documents = await loader.aload()
 
-            documents = await self._collect_async_items(loader.alazy_load())
+        assert documents == expected
 
-            assert documents == [
-                Document(
-                    page_content="1",
-                    metadata={
-                        "variety": {"type": "Granny Smith"},
-                        "organic": 1,
-                    },
-                )
-            ]
+    async def test_lazy_load(self, engine, fruit_table, fruit_table_reset):
+        truncate, insert = fruit_table_reset
+        await self._setup(engine, truncate, (insert, APPLE))
 
-        finally:
-            await self._cleanup_table(engine)
+        loader = await AlloyDBLoader.create(
+            engine=engine,
+            table_name=fruit_table,
+        )
+        assert await self._collect_async_items(loader.alazy_load()) == [APPLE_DOCUMENT]
+        assert list(loader.lazy_load()) == [APPLE_DOCUMENT]
 
-    async def test_load_from_query_customized_content_default_metadata_custom_formatter(
-        self, engine
+    async def test_load_from_query_with_langchain_metadata(
+        self, engine, fruit_table, fruit_table_reset
     ):
-        try:
-            await self._cleanup_table(engine)
-            query = f"""
-                    CREATE TABLE IF NOT EXISTS "{table_name}" (
-                        fruit_id SERIAL PRIMARY KEY,
-                        fruit_name VARCHAR(100) NOT NULL,
-                        variety VARCHAR(50),
-                        quantity_in_stock INT NOT NULL,
-                        price_per_unit INT NOT NULL,
-                        organic INT NOT NULL
-                    )
-                """
-            await aexecute(engine, query)
+        truncate, insert = fruit_table_reset
+        rows = [fruit("Apple", "Granny Smith", 150, 1, 1, {"organic": 1})]
+        await self._setup(engine, truncate, (insert, rows))
 
-            insert_query = f"""
-                        INSERT INTO "{table_name}" (fruit_name, variety, quantity_in_stock, price_per_unit, organic)
-                        VALUES ('Apple', 'Granny Smith', 150, 1, 1);
-                        """
-            await aexecute(engine, insert_query)
+        loader = await AlloyDBLoader.create(
+            engine=engine,
+            query=f'SELECT * FROM "{fruit_table}";',
+            metadata_columns=[
+                "fruit_name",
+                "langchain_metadata",
+            ],
+        )
 
-            def my_formatter(row, content_columns):
-                return "-".join(
-                    str(row[column]) for column in content_columns if column in row
-                )
+        documents = await loader.aload()
 
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                query=f'SELECT * FROM "{table_name}";',
-                content_columns=[
-                    "variety",
-                    "quantity_in_stock",
-                    "price_per_unit",
-                ],
-                formatter=my_formatter,
+        assert documents == [
+            Document(
+                page_content="1",
+                metadata={
+                    "fruit_name": "Apple",
+                    "organic": 1,
+                },
             )
+        ]
 
-            documents = await self._collect_async_items(loader.alazy_load())
-
-            assert documents == [
-                Document(
-                    page_content="Granny Smith-150-1",
-                    metadata={
-                        "fruit_id": 1,
-                        "fruit_name": "Apple",
-                        "organic": 1,
-                    },
-                )
-            ]
-
-        finally:
-            await self._cleanup_table(engine)
-
-    async def test_load_from_query_customized_content_default_metadata_custom_page_content_format(
-        self, engine
+    async def test_load_from_query_with_json(
+        self, engine, fruit_table, fruit_table_reset
     ):
-        try:
-            await self._cleanup_table(engine)
-            query = f"""
-                    CREATE TABLE IF NOT EXISTS "{table_name}" (
-                        fruit_id SERIAL PRIMARY KEY,
-                        fruit_name VARCHAR(100) NOT NULL,
-                        variety VARCHAR(50),
-                        quantity_in_stock INT NOT NULL,
-                        price_per_unit INT NOT NULL,
-                        organic INT NOT NULL
-                    )
-                """
-            await aexecute(engine, query)
-
-            insert_query = f"""
-                            INSERT INTO "{table_name}" (fruit_name, variety, quantity_in_stock, price_per_unit, organic)
-                            VALUES ('Apple', 'Granny Smith', 150, 1, 1);
-                        """
-            await aexecute(engine, insert_query)
-
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                query=f'SELECT * FROM "{table_name}";',
-                content_columns=[
-                    "variety",
-                    "quantity_in_stock",
-                    "price_per_unit",
-                ],
-                format="YAML",
-            )
+        truncate, insert = fruit_table_reset
+        variety = json.dumps({"type": "Granny Smith"})
+        rows = [fruit("Apple", variety, 150, 1, 1, {"organic": 1})]
+        await self._setup(engine, truncate, (insert, rows))
 
-            documents = await self._collect_async_items(loader.alazy_load())
-
-            assert documents == [
-                Document(
-                    page_content="variety: Granny Smith\nquantity_in_stock: 150\nprice_per_unit: 1",
-                    metadata={
-                        "fruit_id": 1,
-                        "fruit_name": "Apple",
-                        "organic": 1,
-                    },
-                )
-            ]
+        loader = await AlloyDBLoader.create(
+            engine=engine,
+            query=f"""
+                SELECT fruit_id, variety::json AS variety, langchain_metadata
+                FROM "{fruit_table}";
+            """,
+            metadata_columns=[
+                "variety",
+            ],
+        )
 
-        finally:
-            await self._cleanup_table(engine)
+        documents = await loader.aload()
 
-    async def test_save_doc_with_default_metadata(self, engine):
-        try:
-            await self._cleanup_table(engine)
-            await engine.ainit_document_table(table_name)
-            test_docs = [
-                Document(
-                    page_content="Apple Granny Smith 150 0.99 1",
-                    metadata={"fruit_id": 1},
-                ),
-                Document(
-                    page_content="Banana Cavendish 200 0.59 0",
-                    metadata={"fruit_id": 2},
-                ),
-                Document(
-                    page_content="Orange Navel 80 1.29 1",
-                    metadata={"fruit_id": 3},
-                ),
-            ]
-            saver = await AlloyDBDocumentSaver.create(
-                engine=engine, table_name=table_name
+        assert documents == [
+            Document(
+                page_content="1",
+                metadata={
+                    "variety": {"type": "Granny Smith"},
+                    "organic": 1,
+                },
             )
-            loader = await AlloyDBLoader.create(engine=engine, table_name=table_name)
+        ]
 
-            await saver.aadd_documents(test_docs)
-            docs = await self._collect_async_items(loader.alazy_load())
+    async def test_save_doc_with_default_metadata(self, engine, table_name):
+        await engine.ainit_document_table(table_name)
+        test_docs = [
+            Document(
+                page_content="Apple Granny Smith 150 0.99 1",
+                metadata={"fruit_id": 1},
+            ),
+            Document(
+                page_content="Banana Cavendish 200 0.59 0",
+                metadata={"fruit_id": 2},
+            ),
+            Document(
+                page_content="Orange Navel 80 1.29 1",
+                metadata={"fruit_id": 3},
+            ),
+        ]
+        saver = await AlloyDBDocumentSaver.create(engine=engine, table_name=table_name)
+        loader = await AlloyDBLoader.create(engine=engine, table_name=table_name)
 
-            assert docs == test_docs
-            assert (
-                await engine._run_as_async(engine._aload_table_schema(table_name))
-            ).columns.keys() == [
-                "page_content",
-                "langchain_metadata",
-            ]
-        finally:
-            await self._cleanup_table(engine)
+        await saver.aadd_documents(test_docs)
+        docs = await loader.aload()
+
+        assert docs == test_docs
+        assert (
+            await engine._run_as_async(engine._aload_table_schema(table_name))
+        ).columns.keys() == [
+            "page_content",
+            "langchain_metadata",
+        ]
 
     @pytest.mark.parametrize("store_metadata", [True, False])
-    async def test_save_doc_with_customized_metadata(self, engine, store_metadata):
-        await self._cleanup_table(engine)
+    async def test_save_doc_with_customized_metadata(
+        self, engine, store_metadata, table_name
+    ):
         await engine.ainit_document_table(
             table_name,
             metadata_columns=[
@@ -597,7 +446,7 @@ class TestLoaderAsync:
         )
 
         await saver.aadd_documents(test_docs)
-        docs = await self._collect_async_items(loader.alazy_load())
+        docs = await loader.aload()
 
         if store_metadata:
             docs == test_docs
@@ -624,80 +473,67 @@ class TestLoaderAsync:
                 "organic",
             ]
 
-    async def test_save_doc_without_metadata(self, engine):
-        try:
-            await self._cleanup_table(engine)
-            await engine.ainit_document_table(table_name, store_metadata=False)
-            test_docs = [
-                Document(
-                    page_content="Granny Smith 150 0.99",
-                    metadata={
-                        "fruit_id": 1,
-                        "fruit_name": "Apple",
-                        "organic": 1,
-                    },
-                ),
-            ]
-            saver = await AlloyDBDocumentSaver.create(
-                engine=engine, table_name=table_name
-            )
-            await saver.aadd_documents(test_docs)
+    async def test_save_doc_without_metadata(self, engine, table_name):
+        await engine.ainit_document_table(table_name, store_metadata=False)
+        test_docs = [
+            Document(
+                page_content="Granny Smith 150 0.99",
+                metadata={
+                    "fruit_id": 1,
+                    "fruit_name": "Apple",
+                    "organic": 1,
+                },
+            ),
+        ]
+        saver = await AlloyDBDocumentSaver.create(engine=engine, table_name=table_name)
+        await saver.aadd_documents(test_docs)
 
-            loader = await AlloyDBLoader.create(
-                engine=engine,
-                table_name=table_name,
-            )
+        loader = await AlloyDBLoader.create(
+            engine=engine,
+            table_name=table_name,
+        )
 
-            docs = await self._collect_async_items(loader.alazy_load())
+        docs = await loader.aload()
 
-            assert docs == [
-                Document(
-                    page_content="Granny Smith 150 0.99",
-                    metadata={},
-                ),
-            ]
-            assert (
-                await engine._run_as_async(engine._aload_table_schema(table_name))
-            ).columns.keys() == [
-                "page_content",
-            ]
-        finally:
-            await self._cleanup_table(engine)
+        assert docs == [
+            Document(
+                page_content="Granny Smith 150 0.99",
+                metadata={},
+            ),
+        ]
+        assert (
+            await engine._run_as_async(engine._aload_table_schema(table_name))
+        ).columns.keys() == [
+            "page_content",
+        ]
 
-    async def test_delete_doc_with_default_metadata(self, engine):
-        await self._cleanup_table(engine)
+    async def test_delete_doc_with_default_metadata(self, engine, table_name):
         await engine.ainit_document_table(table_name)
 
-        try:
-            test_docs = [
-                Document(
-                    page_content="Apple Granny Smith 150 0.99 1",
-                    metadata={"fruit_id": 1},
-                ),
-                Document(
-                    page_content="Banana Cavendish 200 0.59 0 1",
-                    metadata={"fruit_id": 2},
-                ),
-            ]
-            saver = await AlloyDBDocumentSaver.create(
-                engine=engine, table_name=table_name
-            )
-            loader = await AlloyDBLoader.create(engine=engine, table_name=table_name)
+        test_docs = [
+            Document(
+                page_content="Apple Granny Smith 150 0.99 1",
+                metadata={"fruit_id": 1},
+            ),
+            Document(
+                page_content="Banana Cavendish 200 0.59 0 1",
+                metadata={"fruit_id": 2},
+            ),
+        ]
+        saver = await AlloyDBDocumentSaver.create(engine=engine, table_name=table_name)
+        loader = await AlloyDBLoader.create(engine=engine, table_name=table_name)
 
-            await saver.aadd_documents(test_docs)
-            docs = await self._collect_async_items(loader.alazy_load())
-            assert docs == test_docs
+        await saver.aadd_documents(test_docs)
+        docs = await loader.aload()
+        assert docs == test_docs
 
-            await saver.adelete(docs[:1])
-            assert len(await self._collect_async_items(loader.alazy_load())) == 1
+        await saver.adelete(docs[:1])
+        assert len(await loader.aload()) == 1
 
-            await saver.adelete(docs)
-            assert len(await self._collect_async_items(loader.alazy_load())) == 0
-        finally:
-            await self._cleanup_table(engine)
+        await saver.adelete(docs)
+        assert len(await loader.aload()) == 0
 
-    async def test_delete_doc_with_query(self, engine):
-        await self._cleanup_table(engine)
+    async def test_delete_doc_with_query(self, engine, table_name):
         await engine.ainit_document_table(
             table_name,
             metadata_columns=[
@@ -713,53 +549,47 @@ class TestLoaderAsync:
             store_metadata=True,
         )
 
-        try:
-            test_docs = [
-                Document(
-                    page_content="Granny Smith 150 0.99",
-                    metadata={
-                        "fruit-id": 1,
-                        "fruit_name": "Apple",
-                        "organic": True,
-                    },
-                ),
-                Document(
-                    page_content="Cavendish 200 0.59 0",
-                    metadata={
-                        "fruit_id": 2,
-                        "fruit_name": "Banana",
-                        "organic": False,
-                    },
-                ),
-                Document(
-                    page_content="Navel 80 1.29 1",
-                    metadata={
-                        "fruit_id": 3,
-                        "fruit_name": "Orange",
-                        "organic": True,
-                    },
-                ),
-            ]
-            saver = await AlloyDBDocumentSaver.create(
-                engine=engine, table_name=table_name
-            )
-            query = f"SELECT * FROM \"{table_name}\" WHERE fruit_name='Apple';"
-            loader = await AlloyDBLoader.create(engine=engine, query=query)
+        test_docs = [
+            Document(
+                page_content="Granny Smith 150 0.99",
+                metadata={
+                    "fruit-id": 1,
+                    "fruit_name": "Apple",
+                    "organic": True,
+                },
+            ),
+            Document(
+                page_content="Cavendish 200 0.59 0",
+                metadata={
+                    "fruit_id": 2,
+                    "fruit_name": "Banana",
+                    "organic": False,
+                },
+            ),
+            Document(
+                page_content="Navel 80 1.29 1",
+                metadata={
+                    "fruit_id": 3,
+                    "fruit_name": "Orange",
+                    "organic": True,
+                },
+            ),
+        ]
+        saver = await AlloyDBDocumentSaver.create(engine=engine, table_name=table_name)
+        query = f"SELECT * FROM \"{table_name}\" WHERE fruit_name='Apple';"
+        loader = await AlloyDBLoader.create(engine=engine, query=query)
 
-            await saver.aadd_documents(test_docs)
-            docs = await self._collect_async_items(loader.alazy_load())
-            assert len(docs) == 1
+        await saver.aadd_documents(test_docs)
+        docs = await loader.aload()
+        assert len(docs) == 1
 
-            await saver.adelete(docs)
-            assert len(await self._collect_async_items(loader.alazy_load())) == 0
-        finally:
-            await self._cleanup_table(engine)
+        await saver.adelete(docs)
+        assert len(await loader.aload()) == 0
 
     @pytest.mark.parametrize("metadata_json_column", [None, "metadata_col_test"])
     async def test_delete_doc_with_customized_metadata(
-        self, engine, metadata_json_column
+        self, engine, metadata_json_column, table_name
     ):
-        await self._cleanup_table(engine)
         content_column = "content_col_test"
         await engine.ainit_document_table(
             table_name,
@@ -807,52 +637,47 @@ class TestLoaderAsync:
         assert len(docs) == 2
 
         await saver.adelete(docs[:1])
-        assert len(await self._collect_async_items(loader.alazy_load())) == 1
+        assert len(await loader.aload()) == 1
 
         await saver.adelete(docs)
-        assert len(await self._collect_async_items(loader.alazy_load())) == 0
+        assert len(await loader.aload()) == 0
 
-    async def test_sync_engine(self):
+    async def test_sync_engine(self, db_config):
         AlloyDBEngine._connector = None
         engine = AlloyDBEngine.from_instance(
-            project_id=project_id,
-            cluster=cluster_id,
-            instance=instance_id,
-            region=region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         assert engine
         await engine.close()
 
-    async def test_load_from_query_default_sync(self, sync_engine):
-        try:
-            sync_engine._run_as_sync(self._cleanup_table(sync_engine))
-            sync_engine.init_document_table(table_name)
-            saver = AlloyDBDocumentSaver.create_sync(
-                engine=sync_engine, table_name=table_name
-            )
-            test_docs = [
-                Document(
-                    page_content="Cavendish 200 0.59 0",
-                    metadata={
-                        "fruit_id": 2,
-                        "fruit_name": "Banana",
-                        "organic": True,
-                    },
-                ),
-            ]
-
-            saver.add_documents(test_docs)
-            loader = AlloyDBLoader.create_sync(
-                engine=sync_engine,
-                query=f'SELECT * FROM "{table_name}";',
-            )
-            documents = await loader.aload()
-            assert documents == test_docs
+    async def test_load_from_query_default_sync(self, sync_engine, table_name):
+        sync_engine.init_document_table(table_name)
+        saver = AlloyDBDocumentSaver.create_sync(
+            engine=sync_engine, table_name=table_name
+        )
+        test_docs = [
+            Document(
+                page_content="Cavendish 200 0.59 0",
+                metadata={
+                    "fruit_id": 2,
+                    "fruit_name": "Banana",
+                    "organic": True,
+                },
+            ),
+        ]
 
-            saver.delete(test_docs)
-            documents = loader.load()
-            assert len(documents) == 0
+        saver.add_documents(test_docs)
+        loader = AlloyDBLoader.create_sync(
+            engine=sync_engine,
+            query=f'SELECT * FROM "{table_name}";',
+        )
+        documents = await loader.aload()
+        assert documents == test_docs
 
-        finally:
-            sync_engine._run_as_sync(self._cleanup_table(sync_engine))
+        saver.delete(test_docs)
+        documents = loader.load()
+        assert len(documents) == 0
@@ -23,7 +23,6 @@ import pytest_asyncio
 from google.cloud.alloydb.connector import AsyncConnector, IPTypes
 from langchain_core.documents import Document
 from langchain_core.embeddings import DeterministicFakeEmbedding
-from PIL import Image
 from sqlalchemy import text
 from sqlalchemy.engine.row import RowMapping
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
@@ -79,7 +78,8 @@ async def aexecute(
 
 async def afetch(engine: AlloyDBEngine, query: str) -> Sequence[RowMapping]:
     async def run(engine, query):
-        async with engine._pool.connect() as conn:
+        autocommit = engine._pool.execution_options(isolation_level="AUTOCOMMIT")
+        async with autocommit.connect() as conn:
             result = await conn.execute(text(query))
             result_map = result.mappings()
             result_fetch = result_map.fetchall()
@@ -88,28 +88,8 @@ async def afetch(engine: AlloyDBEngine, query: str) -> Sequence[RowMapping]:
     return await engine._run_as_async(run(engine, query))
 
 
-@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.asyncio(loop_scope="session")
 class TestVectorStore:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "database name on AlloyDB instance")
-
     @pytest.fixture(scope="module")
     def user(self) -> str:
         return get_env_var("DB_USER", "database user for AlloyDB")
@@ -119,17 +99,19 @@ class TestVectorStore:
         return get_env_var("DB_PASSWORD", "database password for AlloyDB")
 
     @pytest_asyncio.fixture(scope="class")
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
+    async def engine(self, db_config):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
 
         yield engine
-        await aexecute(engine, f'DROP TABLE IF EXISTS "{DEFAULT_TABLE}"')
+        await aexecute(
+            engine, f'DROP TABLE IF EXISTS "{DEFAULT_TABLE}", "{CUSTOM_TABLE}"'
+        )
         await engine.close()
 
     @pytest_asyncio.fixture(scope="class")
@@ -143,15 +125,13 @@ class TestVectorStore:
         yield vs
 
     @pytest_asyncio.fixture(scope="class")
-    async def engine_sync(
-        self, db_project, db_region, db_cluster, db_instance, db_name
-    ):
+    async def engine_sync(self, db_config):
         engine_sync = AlloyDBEngine.from_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine_sync
 
@@ -191,27 +171,6 @@ class TestVectorStore:
             metadata_json_column="mymeta",
         )
         yield vs
-        await aexecute(engine, f'DROP TABLE IF EXISTS "{CUSTOM_TABLE}"')
-
-    @pytest_asyncio.fixture(scope="class")
-    async def image_uris(self):
-        red_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_red.jpg"
-        green_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_green.jpg"
-        blue_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_blue.jpg"
-        gcs_uri = "gs://github-repo/img/vision/google-cloud-next.jpeg"
-        image = Image.new("RGB", (100, 100), color="red")
-        image.save(red_uri)
-        image = Image.new("RGB", (100, 100), color="green")
-        image.save(green_uri)
-        image = Image.new("RGB", (100, 100), color="blue")
-        image.save(blue_uri)
-        image_uris = [red_uri, green_uri, blue_uri, gcs_uri]
-        yield image_uris
-        for uri in image_uris:
-            try:
-                os.remove(uri)
-            except FileNotFoundError:
-                pass
 
     async def test_init_with_constructor(self, engine):
         with pytest.raises(Exception):
@@ -470,11 +429,7 @@ class TestVectorStore:
 
     async def test_from_engine(
         self,
-        db_project,
-        db_region,
-        db_cluster,
-        db_instance,
-        db_name,
+        db_config,
         user,
         password,
     ):
@@ -482,11 +437,12 @@ class TestVectorStore:
 
             async def getconn():
                 conn = await connector.connect(  # type: ignore
-                    f"projects/{db_project}/locations/{db_region}/clusters/{db_cluster}/instances/{db_instance}",
+                    f"projects/{db_config.project}/locations/{db_config.region}"
+                    f"/clusters/{db_config.cluster}/instances/{db_config.instance}",
                     "asyncpg",
                     user=user,
                     password=password,
-                    db=db_name,
+                    db=db_config.database,
                     enable_iam_auth=False,
                     ip_type=IPTypes.PUBLIC,
                 )
@@ -514,11 +470,7 @@ class TestVectorStore:
 
     async def test_from_engine_loop_connector(
         self,
-        db_project,
-        db_region,
-        db_cluster,
-        db_instance,
-        db_name,
+        db_config,
         user,
         password,
     ):
@@ -529,11 +481,12 @@ class TestVectorStore:
 
             async def getconn():
                 conn = await connector.connect(
-                    f"projects/{db_project}/locations/{db_region}/clusters/{db_cluster}/instances/{db_instance}",
+                    f"projects/{db_config.project}/locations/{db_config.region}"
+                    f"/clusters/{db_config.cluster}/instances/{db_config.instance}",
                     "asyncpg",
                     user=user,
                     password=password,
-                    db=db_name,
+                    db=db_config.database,
                     enable_iam_auth=False,
                     ip_type="PUBLIC",
                 )
@@ -583,12 +536,14 @@ class TestVectorStore:
 
     async def test_from_engine_args_url(
         self,
-        db_name,
+        db_config,
         user,
         password,
     ):
         port = "5432"
-        url = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+        url = (
+            f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_config.database}"
+        )
         engine = AlloyDBEngine.from_engine_args(url)
         table_name = "test_table" + str(uuid.uuid4()).replace("-", "_")
         await engine.ainit_vectorstore_table(table_name, VECTOR_SIZE)
@@ -617,12 +572,14 @@ class TestVectorStore:
 
     async def test_from_engine_loop(
         self,
-        db_name,
+        db_config,
         user,
         password,
     ):
         port = "5432"
-        url = f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}"
+        url = (
+            f"postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_config.database}"
+        )
 
         loop = asyncio.new_event_loop()
         thread = Thread(target=loop.run_forever, daemon=True)
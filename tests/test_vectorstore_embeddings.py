@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
+import asyncio
 import uuid
 
 import pytest
@@ -43,13 +43,6 @@ docs = [
 ]
 
 
-def get_env_var(key: str, desc: str) -> str:
-    v = os.environ.get(key)
-    if v is None:
-        raise ValueError(f"Must set env var {key} to: {desc}")
-    return v
-
-
 async def aexecute(
     engine: AlloyDBEngine,
     query: str,
@@ -62,52 +55,30 @@ async def aexecute(
     await engine._run_as_async(run(engine, query))
 
 
-@pytest.mark.asyncio(loop_scope="class")
-class TestVectorStoreEmbeddings:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
+@pytest_asyncio.fixture(scope="module")
+async def embeddings_service(shared_engine: AlloyDBEngine) -> AlloyDBEmbeddings:
+    # Both classes embed with the same model, so its existence is checked once.
+    return await AlloyDBEmbeddings.create(shared_engine, DEFAULT_EMBEDDING_MODEL)
 
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "instance for AlloyDB")
 
+@pytest.mark.asyncio(loop_scope="session")
+class TestVectorStoreEmbeddings:
     @pytest_asyncio.fixture(scope="class")
     async def engine(
         self,
-        db_project,
-        db_region,
-        db_cluster,
-        db_instance,
-        db_name,
+        db_config,
     ):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
-        await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE}")
+        await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE}, {CUSTOM_TABLE}")
         await engine.close()
 
-    @pytest_asyncio.fixture(scope="class")
-    async def embeddings_service(self, engine):
-        return await AlloyDBEmbeddings.create(engine, DEFAULT_EMBEDDING_MODEL)
-
     @pytest_asyncio.fixture(scope="class")
     async def vs(self, engine, embeddings_service):
         await engine.ainit_vectorstore_table(
@@ -125,21 +96,16 @@ class TestVectorStoreEmbeddings:
     @pytest_asyncio.fixture(scope="class")
     async def engine_sync(
         self,
-        db_project,
-        db_region,
-        db_cluster,
-        db_instance,
-        db_name,
+        db_config,
     ):
         engine = AlloyDBEngine.from_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
-        await aexecute(engine, f"DROP TABLE IF EXISTS {CUSTOM_TABLE}")
         await engine.close()
 
     @pytest_asyncio.fixture(scope="class")
@@ -170,11 +136,13 @@ class TestVectorStoreEmbeddings:
         yield vs_custom
 
     async def test_asimilarity_search(self, vs):
-        results = await vs.asimilarity_search("foo", k=1)
+        results, filtered = await asyncio.gather(
+            vs.asimilarity_search("foo", k=1),
+            vs.asimilarity_search("foo", k=1, filter="content = 'bar'"),
+        )
         assert len(results) == 1
         assert results == [Document(page_content="foo")]
-        results = await vs.asimilarity_search("foo", k=1, filter="content = 'bar'")
-        assert results == [Document(page_content="bar")]
+        assert filtered == [Document(page_content="bar")]
 
     async def test_asimilarity_search_score(self, vs):
         results = await vs.asimilarity_search_with_score("foo")
@@ -184,30 +152,26 @@ class TestVectorStoreEmbeddings:
 
     async def test_asimilarity_search_by_vector(self, vs, embeddings_service):
         search_embedding = embeddings_service.embed_query("foo")
-        results = await vs.asimilarity_search_by_vector(search_embedding)
+        results, scored = await asyncio.gather(
+            vs.asimilarity_search_by_vector(search_embedding),
+            vs.asimilarity_search_with_score_by_vector(search_embedding),
+        )
         assert len(results) == 4
         assert results[0] == Document(page_content="foo")
-        results = await vs.asimilarity_search_with_score_by_vector(search_embedding)
-        assert results[0][0] == Document(page_content="foo")
-        assert results[0][1] == 0
+        assert scored[0][0] == Document(page_content="foo")
+        assert scored[0][1] == 0
 
     async def test_similarity_search_with_relevance_scores_threshold_cosine(self, vs):
-        score_threshold = {"score_threshold": 0}
-        results = await vs.asimilarity_search_with_relevance_scores(
-            "foo", **score_threshold
-        )
-        assert len(results) == 4
-
-        score_threshold = {"score_threshold": 0.73}
-        results = await vs.asimilarity_search_with_relevance_scores(
-            "foo", **score_threshold
-        )
-        assert len(results) == 2
-
-        score_threshold = {"score_threshold": 0.8}
-        results = await vs.asimilarity_search_with_relevance_scores(
-            "foo", **score_threshold
+        all_results, some_results, results = await asyncio.gather(
+            *(
+                vs.asimilarity_search_with_relevance_scores(
+                    "foo", score_threshold=score_threshold
+                )
+                for score_threshold in (0, 0.73, 0.8)
+            )
         )
+        assert len(all_results) == 4
+        assert len(some_results) == 2
         assert len(results) == 1
         assert results[0][0] == Document(page_content="foo")
 
@@ -229,12 +193,12 @@ class TestVectorStoreEmbeddings:
         assert results[0][0] == Document(page_content="foo")
 
     async def test_amax_marginal_relevance_search(self, vs):
-        results = await vs.amax_marginal_relevance_search("bar")
-        assert results[0] == Document(page_content="bar")
-        results = await vs.amax_marginal_relevance_search(
-            "bar", filter="content = 'boo'"
+        results, filtered = await asyncio.gather(
+            vs.amax_marginal_relevance_search("bar"),
+            vs.amax_marginal_relevance_search("bar", filter="content = 'boo'"),
         )
-        assert results[0] == Document(page_content="boo")
+        assert results[0] == Document(page_content="bar")
+        assert filtered[0] == Document(page_content="boo")
 
     async def test_amax_marginal_relevance_search_vector(self, vs, embeddings_service):
         embedding = embeddings_service.embed_query("bar")
@@ -245,62 +209,33 @@ class TestVectorStoreEmbeddings:
         self, vs, embeddings_service
     ):
         embedding = embeddings_service.embed_query("bar")
-        results = await vs.amax_marginal_relevance_search_with_score_by_vector(
-            embedding
-        )
-        assert results[0][0] == Document(page_content="bar")
-
-        results = await vs.amax_marginal_relevance_search_with_score_by_vector(
-            embedding, lambda_mult=0.75, fetch_k=10
+        results, tuned_results = await asyncio.gather(
+            vs.amax_marginal_relevance_search_with_score_by_vector(embedding),
+            vs.amax_marginal_relevance_search_with_score_by_vector(
+                embedding, lambda_mult=0.75, fetch_k=10
+            ),
         )
         assert results[0][0] == Document(page_content="bar")
+        assert tuned_results[0][0] == Document(page_content="bar")
 
 
 class TestVectorStoreEmbeddingsSync:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "instance for AlloyDB")
-
     @pytest_asyncio.fixture(scope="class")
     async def engine_sync(
         self,
-        db_project,
-        db_region,
-        db_cluster,
-        db_instance,
-        db_name,
+        db_config,
     ):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
         await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE_SYNC}")
         await engine.close()
 
-    @pytest_asyncio.fixture(scope="class")
-    def embeddings_service(self, engine_sync):
-        return AlloyDBEmbeddings.create_sync(engine_sync, DEFAULT_EMBEDDING_MODEL)
-
     @pytest_asyncio.fixture(scope="class")
     async def vs_custom(self, engine_sync, embeddings_service):
         engine_sync.init_vectorstore_table(
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
 import uuid
 from typing import Sequence
 
@@ -20,9 +19,8 @@ import pytest
 import pytest_asyncio
 from langchain_core.documents import Document
 from langchain_core.embeddings import DeterministicFakeEmbedding
-from sqlalchemy import VARCHAR, text
+from sqlalchemy import text
 from sqlalchemy.engine.row import RowMapping
-from sqlalchemy.ext.asyncio import create_async_engine
 
 from langchain_google_alloydb_pg import AlloyDBEngine, AlloyDBVectorStore, Column
 
@@ -46,15 +44,6 @@ docs = [
     Document(page_content=texts[i], metadata=metadatas[i]) for i in range(len(texts))
 ]
 
-embeddings = [embeddings_service.embed_query(texts[i]) for i in range(len(texts))]
-
-
-def get_env_var(key: str, desc: str) -> str:
-    v = os.environ.get(key)
-    if v is None:
-        raise ValueError(f"Must set env var {key} to: {desc}")
-    return v
-
 
 async def aexecute(
     engine: AlloyDBEngine,
@@ -70,7 +59,8 @@ async def aexecute(
 
 async def afetch(engine: AlloyDBEngine, query: str) -> Sequence[RowMapping]:
     async def run(engine, query):
-        async with engine._pool.connect() as conn:
+        autocommit = engine._pool.execution_options(isolation_level="AUTOCOMMIT")
+        async with autocommit.connect() as conn:
             result = await conn.execute(text(query))
             result_map = result.mappings()
             result_fetch = result_map.fetchall()
@@ -81,34 +71,14 @@ async def afetch(engine: AlloyDBEngine, query: str) -> Sequence[RowMapping]:
 
 @pytest.mark.asyncio
 class TestVectorStoreFromMethods:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "database name on AlloyDB instance")
-
-    @pytest_asyncio.fixture
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
+    @pytest_asyncio.fixture(scope="class")
+    async def engine(self, db_config):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         await engine.ainit_vectorstore_table(DEFAULT_TABLE, VECTOR_SIZE)
         await engine.ainit_vectorstore_table(
@@ -130,21 +100,21 @@ class TestVectorStoreFromMethods:
             store_metadata=False,
         )
         yield engine
-        await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE}")
-        await aexecute(engine, f"DROP TABLE IF EXISTS {CUSTOM_TABLE}")
-        await aexecute(engine, f"DROP TABLE IF EXISTS {CUSTOM_TABLE_WITH_INT_ID}")
+        await aexecute(
+            engine,
+            f"DROP TABLE IF EXISTS {DEFAULT_TABLE}, {CUSTOM_TABLE}, "
+            f"{CUSTOM_TABLE_WITH_INT_ID}",
+        )
         await engine.close()
 
-    @pytest_asyncio.fixture
-    async def engine_sync(
-        self, db_project, db_region, db_cluster, db_instance, db_name
-    ):
+    @pytest_asyncio.fixture(scope="class")
+    async def engine_sync(self, db_config):
         engine = AlloyDBEngine.from_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         engine.init_vectorstore_table(DEFAULT_TABLE_SYNC, VECTOR_SIZE)
         engine.init_vectorstore_table(
@@ -158,10 +128,24 @@ class TestVectorStoreFromMethods:
         )
 
         yield engine
-        await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE_SYNC}")
-        await aexecute(engine, f"DROP TABLE IF EXISTS {CUSTOM_TABLE_WITH_INT_ID_SYNC}")
+        await aexecute(
+            engine,
+            f"DROP TABLE IF EXISTS {DEFAULT_TABLE_SYNC}, {CUSTOM_TABLE_WITH_INT_ID_SYNC}",
+        )
         await engine.close()
 
+    @pytest_asyncio.fixture(autouse=True)
+    async def truncate_tables(self, engine, engine_sync):
+        # The tables live for the whole class; empty them after every test,
+        # including failed ones, in a single statement.
+        yield
+        await aexecute(
+            engine,
+            f"TRUNCATE TABLE {DEFAULT_TABLE}, {CUSTOM_TABLE}, "
+            f"{CUSTOM_TABLE_WITH_INT_ID}, {DEFAULT_TABLE_SYNC}, "
+            f"{CUSTOM_TABLE_WITH_INT_ID_SYNC}",
+        )
+
     async def test_afrom_texts(self, engine):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
         await AlloyDBVectorStore.afrom_texts(
@@ -174,7 +158,6 @@ class TestVectorStoreFromMethods:
         )
         results = await afetch(engine, f"SELECT * FROM {DEFAULT_TABLE}")
         assert len(results) == 3
-        await aexecute(engine, f"TRUNCATE TABLE {DEFAULT_TABLE}")
 
     async def test_from_texts(self, engine_sync):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
@@ -188,7 +171,6 @@ class TestVectorStoreFromMethods:
         )
         results = await afetch(engine_sync, f"SELECT * FROM {DEFAULT_TABLE_SYNC}")
         assert len(results) == 3
-        await aexecute(engine_sync, f"TRUNCATE TABLE {DEFAULT_TABLE_SYNC}")
 
     async def test_afrom_docs(self, engine):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
@@ -201,7 +183,6 @@ class TestVectorStoreFromMethods:
         )
         results = await afetch(engine, f"SELECT * FROM {DEFAULT_TABLE}")
         assert len(results) == 3
-        await aexecute(engine, f"TRUNCATE TABLE {DEFAULT_TABLE}")
 
     async def test_from_docs(self, engine_sync):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
@@ -214,7 +195,6 @@ class TestVectorStoreFromMethods:
         )
         results = await afetch(engine_sync, f"SELECT * FROM {DEFAULT_TABLE_SYNC}")
         assert len(results) == 3
-        await aexecute(engine_sync, f"TRUNCATE TABLE {DEFAULT_TABLE_SYNC}")
 
     async def test_afrom_docs_cross_env(self, engine_sync):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
@@ -227,7 +207,6 @@ class TestVectorStoreFromMethods:
         )
         results = await afetch(engine_sync, f"SELECT * FROM {DEFAULT_TABLE_SYNC}")
         assert len(results) == 3
-        await aexecute(engine_sync, f"TRUNCATE TABLE {DEFAULT_TABLE_SYNC}")
 
     async def test_from_docs_cross_env(self, engine, engine_sync):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
@@ -240,7 +219,6 @@ class TestVectorStoreFromMethods:
         )
         results = await afetch(engine, f"SELECT * FROM {DEFAULT_TABLE_SYNC}")
         assert len(results) == 3
-        await aexecute(engine, f"TRUNCATE TABLE {DEFAULT_TABLE_SYNC}")
 
     async def test_afrom_texts_custom(self, engine):
         ids = [str(uuid.uuid4()) for i in range(len(texts))]
@@ -289,7 +267,6 @@ class TestVectorStoreFromMethods:
         assert results[0]["myembedding"]
         assert results[0]["page"] == "0"
         assert results[0]["source"] == "google.com"
-        await aexecute(engine, f"TRUNCATE TABLE {CUSTOM_TABLE}")
 
     async def test_afrom_texts_custom_with_int_id(self, engine):
         ids = [i for i in range(len(texts))]
@@ -309,7 +286,6 @@ class TestVectorStoreFromMethods:
         assert len(results) == 3
         for row in results:
             assert isinstance(row["integer_id"], int)
-        await aexecute(engine, f"TRUNCATE TABLE {CUSTOM_TABLE_WITH_INT_ID}")
 
     async def test_from_texts_custom_with_int_id(self, engine_sync):
         ids = [i for i in range(len(texts))]
@@ -330,4 +306,3 @@ class TestVectorStoreFromMethods:
         assert len(results) == 3
         for row in results:
             assert isinstance(row["integer_id"], int)
-        await aexecute(engine_sync, f"TRUNCATE TABLE {CUSTOM_TABLE_WITH_INT_ID_SYNC}")
@@ -13,14 +13,13 @@
 # limitations under the License.
 
 
+import asyncio
 import os
-import sys
 import uuid
 
 import pytest
 import pytest_asyncio
 import sqlalchemy
-from langchain_core.documents import Document
 from langchain_core.embeddings import DeterministicFakeEmbedding
 from sqlalchemy import text
 
@@ -41,18 +40,13 @@ CUSTOM_TABLE = "test_table_custom" + str(uuid.uuid4()).replace("-", "_")
 DEFAULT_INDEX_NAME = DEFAULT_TABLE + DEFAULT_INDEX_NAME_SUFFIX
 DEFAULT_INDEX_NAME_ASYNC = DEFAULT_TABLE_ASYNC + DEFAULT_INDEX_NAME_SUFFIX
 DEFAULT_INDEX_NAME_OMNI = DEFAULT_TABLE_OMNI + DEFAULT_INDEX_NAME_SUFFIX
+SECOND_INDEX_NAME = "secondindex" + str(uuid.uuid4()).replace("-", "_")
 VECTOR_SIZE = 768
 
 embeddings_service = DeterministicFakeEmbedding(size=VECTOR_SIZE)
 
 texts = ["foo", "bar", "baz"]
 ids = [str(uuid.uuid4()) for i in range(len(texts))]
-metadatas = [{"page": str(i), "source": "google.com"} for i in range(len(texts))]
-docs = [
-    Document(page_content=texts[i], metadata=metadatas[i]) for i in range(len(texts))
-]
-
-embeddings = [embeddings_service.embed_query("foo") for i in range(len(texts))]
 
 
 def get_env_var(key: str, desc: str) -> str:
@@ -74,36 +68,16 @@ async def aexecute(
     await engine._run_as_async(run(engine, query))
 
 
-@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.asyncio(loop_scope="session")
 class TestIndex:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "instance for AlloyDB")
-
     @pytest_asyncio.fixture(scope="class")
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
+    async def engine(self, db_config):
         engine = AlloyDBEngine.from_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            cluster=db_config.cluster,
+            instance=db_config.instance,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
         await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE}")
@@ -119,7 +93,6 @@ class TestIndex:
         )
 
         vs.add_texts(texts, ids=ids)
-        vs.drop_vector_index()
         yield vs
 
     async def test_aapply_vector_index(self, vs):
@@ -128,9 +101,7 @@ class TestIndex:
         assert vs.is_valid_index(DEFAULT_INDEX_NAME)
 
     async def test_areindex(self, vs):
-        if not vs.is_valid_index(DEFAULT_INDEX_NAME):
-            index = HNSWIndex()
-            vs.apply_vector_index(index)
+        assert vs.is_valid_index(DEFAULT_INDEX_NAME)
         vs.reindex()
         vs.reindex(DEFAULT_INDEX_NAME)
         assert vs.is_valid_index(DEFAULT_INDEX_NAME)
@@ -145,48 +116,28 @@ class TestIndex:
         vs.apply_vector_index(index, concurrently=True)
         assert vs.is_valid_index(DEFAULT_INDEX_NAME)
         index = IVFFlatIndex(
-            name="secondindex",
+            name=SECOND_INDEX_NAME,
             distance_strategy=DistanceStrategy.INNER_PRODUCT,
         )
         vs.apply_vector_index(index)
-        assert vs.is_valid_index("secondindex")
-        vs.drop_vector_index("secondindex")
+        assert vs.is_valid_index(SECOND_INDEX_NAME)
+        vs.drop_vector_index(SECOND_INDEX_NAME)
 
     async def test_is_valid_index(self, vs):
         is_valid = vs.is_valid_index("invalid_index")
         assert is_valid == False
 
 
-@pytest.mark.asyncio(loop_scope="class")
+@pytest.mark.asyncio(loop_scope="session")
 class TestAsyncIndex:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "instance for AlloyDB")
-
     @pytest_asyncio.fixture(scope="class")
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
+    async def engine(self, db_config):
         engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            instance=db_instance,
-            cluster=db_cluster,
-            region=db_region,
-            database=db_name,
+            project_id=db_config.project,
+            instance=db_config.instance,
+            cluster=db_config.cluster,
+            region=db_config.region,
+            database=db_config.database,
         )
         yield engine
         await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE_ASYNC}")
@@ -202,7 +153,6 @@ class TestAsyncIndex:
         )
 
         await vs.aadd_texts(texts, ids=ids)
-        await vs.adrop_vector_index()
         yield vs
 
     @pytest.fixture(scope="module")
@@ -250,9 +200,7 @@ class TestAsyncIndex:
         assert await vs.ais_valid_index(DEFAULT_INDEX_NAME_ASYNC)
 
     async def test_areindex(self, vs):
-        if not await vs.ais_valid_index(DEFAULT_INDEX_NAME_ASYNC):
-            index = HNSWIndex()
-            await vs.aapply_vector_index(index)
+        assert await vs.ais_valid_index(DEFAULT_INDEX_NAME_ASYNC)
         await vs.areindex()
         await vs.areindex(DEFAULT_INDEX_NAME_ASYNC)
         assert await vs.ais_valid_index(DEFAULT_INDEX_NAME_ASYNC)
@@ -267,13 +215,14 @@ class TestAsyncIndex:
         await vs.aapply_vector_index(index, concurrently=True)
         assert await vs.ais_valid_index(DEFAULT_INDEX_NAME_ASYNC)
         index = IVFFlatIndex(
-            name="secondindex",
+            name=SECOND_INDEX_NAME,
             distance_strategy=DistanceStrategy.INNER_PRODUCT,
         )
         await vs.aapply_vector_index(index)
-        assert await vs.ais_valid_index("secondindex")
-        await vs.adrop_vector_index("secondindex")
-        await vs.adrop_vector_index()
+        assert await vs.ais_valid_index(SECOND_INDEX_NAME)
+        await asyncio.gather(
+            vs.adrop_vector_index(SECOND_INDEX_NAME), vs.adrop_vector_index()
+        )
 
     async def test_is_valid_index(self, vs):
         is_valid = await vs.ais_valid_index("invalid_index")
@@ -284,13 +233,14 @@ class TestAsyncIndex:
         await vs.aapply_vector_index(index, concurrently=True)
         assert await vs.ais_valid_index(DEFAULT_INDEX_NAME_ASYNC)
         index = IVFIndex(
-            name="secondindex",
+            name=SECOND_INDEX_NAME,
             distance_strategy=DistanceStrategy.INNER_PRODUCT,
         )
         await vs.aapply_vector_index(index)
-        assert await vs.ais_valid_index("secondindex")
-        await vs.adrop_vector_index("secondindex")
-        await vs.adrop_vector_index()
+        assert await vs.ais_valid_index(SECOND_INDEX_NAME)
+        await asyncio.gather(
+            vs.adrop_vector_index(SECOND_INDEX_NAME), vs.adrop_vector_index()
+        )
 
     async def test_aapply_alloydb_scann_index_ScaNN(self, omni_vs):
         index = ScaNNIndex(distance_strategy=DistanceStrategy.EUCLIDEAN)
@@ -298,10 +248,10 @@ class TestAsyncIndex:
         await omni_vs.aapply_vector_index(index, concurrently=True)
         assert await omni_vs.ais_valid_index(DEFAULT_INDEX_NAME_OMNI)
         index = ScaNNIndex(
-            name="secondindex",
+            name=SECOND_INDEX_NAME,
             distance_strategy=DistanceStrategy.COSINE_DISTANCE,
         )
         await omni_vs.aapply_vector_index(index)
-        assert await omni_vs.ais_valid_index("secondindex")
-        await omni_vs.adrop_vector_index("secondindex")
+        assert await omni_vs.ais_valid_index(SECOND_INDEX_NAME)
+        await omni_vs.adrop_vector_index(SECOND_INDEX_NAME)
         await omni_vs.adrop_vector_index()
@@ -12,24 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import os
+import asyncio
 import uuid
 
 import pytest
 import pytest_asyncio
 from langchain_core.documents import Document
 from langchain_core.embeddings import DeterministicFakeEmbedding
-from PIL import Image
 from sqlalchemy import text
 
 from langchain_google_alloydb_pg import AlloyDBEngine, AlloyDBVectorStore, Column
 from langchain_google_alloydb_pg.indexes import DistanceStrategy, HNSWQueryOptions
 
-DEFAULT_TABLE = "test_table" + str(uuid.uuid4()).replace("-", "_")
-DEFAULT_TABLE_SYNC = "test_table" + str(uuid.uuid4()).replace("-", "_")
-CUSTOM_TABLE = "test_table_custom" + str(uuid.uuid4()).replace("-", "_")
-IMAGE_TABLE = "test_image_table" + str(uuid.uuid4()).replace("-", "_")
-IMAGE_TABLE_SYNC = "test_image_table_sync" + str(uuid.uuid4()).replace("-", "_")
+DEFAULT_TABLE = "test_table" + uuid.uuid4().hex
+CUSTOM_TABLE = "test_table_custom" + uuid.uuid4().hex
+IMAGE_TABLE = "test_image_table" + uuid.uuid4().hex
+IMAGE_TABLE_SYNC = "test_image_table_sync" + uuid.uuid4().hex
 VECTOR_SIZE = 768
 
 embeddings_service = DeterministicFakeEmbedding(size=VECTOR_SIZE)
@@ -39,13 +37,14 @@ embeddings_service = DeterministicFakeEmbedding(size=VECTOR_SIZE)
 # that the test cases can effectively validate the filtering and scoring logic.
 # The scoring might be different if using a different embedding service.
 texts = ["foo", "bar", "baz", "boo"]
-ids = [str(uuid.uuid4()) for i in range(len(texts))]
-metadatas = [{"page": str(i), "source": "google.com"} for i in range(len(texts))]
-docs = [
-    Document(page_content=texts[i], metadata=metadatas[i]) for i in range(len(texts))
-]
+docs = tuple(
+    Document(page_content=text_, metadata={"page": str(i), "source": "google.com"})
+    for i, text_ in enumerate(texts)
+)
 
-embeddings = [embeddings_service.embed_query("foo") for i in range(len(texts))]
+
+FOO_EMBEDDING = embeddings_service.embed_query("foo")
+BAR_EMBEDDING = embeddings_service.embed_query("bar")
 
 
 class FakeImageEmbedding(DeterministicFakeEmbedding):
@@ -57,13 +56,6 @@ class FakeImageEmbedding(DeterministicFakeEmbedding):
 image_embedding_service = FakeImageEmbedding(size=VECTOR_SIZE)
 
 
-def get_env_var(key: str, desc: str) -> str:
-    v = os.environ.get(key)
-    if v is None:
-        raise ValueError(f"Must set env var {key} to: {desc}")
-    return v
-
-
 async def aexecute(
     engine: AlloyDBEngine,
     query: str,
@@ -76,42 +68,45 @@ async def aexecute(
     await engine._run_as_async(run(engine, query))
 
 
-@pytest.mark.asyncio(loop_scope="class")
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def vs_custom(shared_engine):
+    """Custom-column store shared by the async and sync interface tests."""
+    shared_engine.init_vectorstore_table(
+        CUSTOM_TABLE,
+        VECTOR_SIZE,
+        id_column="myid",
+        content_column="mycontent",
+        embedding_column="myembedding",
+        metadata_columns=[
+            Column("page", "TEXT"),
+            Column("source", "TEXT"),
+        ],
+        store_metadata=False,
+    )
+
+    vs_custom = AlloyDBVectorStore.create_sync(
+        shared_engine,
+        embedding_service=embeddings_service,
+        table_name=CUSTOM_TABLE,
+        id_column="myid",
+        content_column="mycontent",
+        embedding_column="myembedding",
+        index_query_options=HNSWQueryOptions(ef_search=1),
+    )
+    ids = [uuid.uuid4().hex for _ in range(len(texts))]
+    vs_custom.add_documents(list(docs), ids=ids)
+    yield vs_custom
+    await aexecute(shared_engine, f"DROP TABLE IF EXISTS {CUSTOM_TABLE}")
+
+
+@pytest.mark.asyncio(loop_scope="session")
 class TestVectorStoreSearch:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "instance for AlloyDB")
-
-    @pytest_asyncio.fixture(scope="class")
-    async def engine(self, db_project, db_region, db_cluster, db_instance, db_name):
-        engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
-        )
-        yield engine
-        await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE}")
-        await engine.close()
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
+    async def engine(self, shared_engine):
+        yield shared_engine
+        await aexecute(shared_engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE}")
 
-    @pytest_asyncio.fixture(scope="class")
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
     async def vs(self, engine):
         await engine.ainit_vectorstore_table(
             DEFAULT_TABLE, VECTOR_SIZE, store_metadata=False
@@ -121,73 +116,11 @@ class TestVectorStoreSearch:
             embedding_service=embeddings_service,
             table_name=DEFAULT_TABLE,
         )
-        ids = [str(uuid.uuid4()) for i in range(len(texts))]
-        await vs.aadd_documents(docs, ids=ids)
+        ids = [uuid.uuid4().hex for _ in range(len(texts))]
+        await vs.aadd_documents(list(docs), ids=ids)
         yield vs
 
-    @pytest_asyncio.fixture(scope="class")
-    async def engine_sync(
-        self, db_project, db_region, db_cluster, db_instance, db_name
-    ):
-        engine = AlloyDBEngine.from_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
-        )
-        yield engine
-        await aexecute(engine, f"DROP TABLE IF EXISTS {CUSTOM_TABLE}")
-        await engine.close()
-
-    @pytest_asyncio.fixture(scope="class")
-    async def vs_custom(self, engine_sync):
-        engine_sync.init_vectorstore_table(
-            CUSTOM_TABLE,
-            VECTOR_SIZE,
-            id_column="myid",
-            content_column="mycontent",
-            embedding_column="myembedding",
-            metadata_columns=[
-                Column("page", "TEXT"),
-                Column("source", "TEXT"),
-            ],
-            store_metadata=False,
-        )
-
-        vs_custom = AlloyDBVectorStore.create_sync(
-            engine_sync,
-            embedding_service=embeddings_service,
-            table_name=CUSTOM_TABLE,
-            id_column="myid",
-            content_column="mycontent",
-            embedding_column="myembedding",
-            index_query_options=HNSWQueryOptions(ef_search=1),
-        )
-        vs_custom.add_documents(docs, ids=ids)
-        yield vs_custom
-
-    @pytest_asyncio.fixture(scope="class")
-    async def image_uris(self):
-        red_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_red.jpg"
-        green_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_green.jpg"
-        blue_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_blue.jpg"
-        gcs_uri = "gs://github-repo/img/vision/google-cloud-next.jpeg"
-        image = Image.new("RGB", (100, 100), color="red")
-        image.save(red_uri)
-        image = Image.new("RGB", (100, 100), color="green")
-        image.save(green_uri)
-        image = Image.new("RGB", (100, 100), color="blue")
-        image.save(blue_uri)
-        image_uris = [red_uri, green_uri, blue_uri, gcs_uri]
-        yield image_uris
-        for uri in image_uris:
-            try:
-                os.remove(uri)
-            except FileNotFoundError:
-                pass
-
-    @pytest_asyncio.fixture(scope="class")
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
     async def image_vs(self, engine, image_uris):
         await engine.ainit_vectorstore_table(IMAGE_TABLE, VECTOR_SIZE)
         vs = await AlloyDBVectorStore.create(
@@ -196,24 +129,28 @@ class TestVectorStoreSearch:
             table_name=IMAGE_TABLE,
             distance_strategy=DistanceStrategy.COSINE_DISTANCE,
         )
-        ids = [str(uuid.uuid4()) for i in range(len(image_uris))]
+        ids = [uuid.uuid4().hex for _ in range(len(image_uris))]
         await vs.aadd_images(image_uris, ids=ids)
         yield vs
 
     async def test_asimilarity_search(self, vs):
-        results = await vs.asimilarity_search("foo", k=1)
+        results, filtered = await asyncio.gather(
+            vs.asimilarity_search("foo", k=1),
+            vs.asimilarity_search("foo", k=1, filter="content = 'bar'"),
+        )
         assert len(results) == 1
         assert results == [Document(page_content="foo")]
-        results = await vs.asimilarity_search("foo", k=1, filter="content = 'bar'")
-        assert results == [Document(page_content="bar")]
+        assert filtered == [Document(page_content="bar")]
 
     async def test_asimilarity_search_image(self, image_vs, image_uris):
-        results = await image_vs.asimilarity_search_image(image_uris[0], k=1)
+        results, gcs_results = await asyncio.gather(
+            image_vs.asimilarity_search_image(image_uris[0], k=1),
+            image_vs.asimilarity_search_image(image_uris[3], k=1),
+        )
         assert len(results) == 1
         assert results[0].metadata["image_uri"] == image_uris[0]
-        results = await image_vs.asimilarity_search_image(image_uris[3], k=1)
-        assert len(results) == 1
-        assert results[0].metadata["image_uri"] == image_uris[3]
+        assert len(gcs_results) == 1
+        assert gcs_results[0].metadata["image_uri"] == image_uris[3]
 
     async def test_asimilarity_search_score(self, vs):
         results = await vs.asimilarity_search_with_score("foo")
@@ -222,31 +159,27 @@ class TestVectorStoreSearch:
         assert results[0][1] == 0
 
     async def test_asimilarity_search_by_vector(self, vs):
-        embedding = embeddings_service.embed_query("foo")
-        results = await vs.asimilarity_search_by_vector(embedding)
+        embedding = FOO_EMBEDDING
+        results, scored = await asyncio.gather(
+            vs.asimilarity_search_by_vector(embedding),
+            vs.asimilarity_search_with_score_by_vector(embedding),
+        )
         assert len(results) == 4
         assert results[0] == Document(page_content="foo")
-        results = await vs.asimilarity_search_with_score_by_vector(embedding)
-        assert results[0][0] == Document(page_content="foo")
-        assert results[0][1] == 0
+        assert scored[0][0] == Document(page_content="foo")
+        assert scored[0][1] == 0
 
     async def test_similarity_search_with_relevance_scores_threshold_cosine(self, vs):
-        score_threshold = {"score_threshold": 0}
-        results = await vs.asimilarity_search_with_relevance_scores(
-            "foo", **score_threshold
-        )
-        assert len(results) == 4
-
-        score_threshold = {"score_threshold": 0.02}
-        results = await vs.asimilarity_search_with_relevance_scores(
-            "foo", **score_threshold
-        )
-        assert len(results) == 2
-
-        score_threshold = {"score_threshold": 0.9}
-        results = await vs.asimilarity_search_with_relevance_scores(
-            "foo", **score_threshold
+        all_results, some_results, results = await asyncio.gather(
+            *(
+                vs.asimilarity_search_with_relevance_scores(
+                    "foo", score_threshold=score_threshold
+                )
+                for score_threshold in (0, 0.02, 0.9)
+            )
         )
+        assert len(all_results) == 4
+        assert len(some_results) == 2
         assert len(results) == 1
         assert results[0][0] == Document(page_content="foo")
 
@@ -268,111 +201,37 @@ class TestVectorStoreSearch:
         assert results[0][0] == Document(page_content="foo")
 
     async def test_amax_marginal_relevance_search(self, vs):
-        results = await vs.amax_marginal_relevance_search("bar")
-        assert results[0] == Document(page_content="bar")
-        results = await vs.amax_marginal_relevance_search(
-            "bar", filter="content = 'boo'"
+        results, filtered = await asyncio.gather(
+            vs.amax_marginal_relevance_search("bar"),
+            vs.amax_marginal_relevance_search("bar", filter="content = 'boo'"),
         )
-        assert results[0] == Document(page_content="boo")
+        assert results[0] == Document(page_content="bar")
+        assert filtered[0] == Document(page_content="boo")
 
     async def test_amax_marginal_relevance_search_vector(self, vs):
-        embedding = embeddings_service.embed_query("bar")
+        embedding = BAR_EMBEDDING
         results = await vs.amax_marginal_relevance_search_by_vector(embedding)
         assert results[0] == Document(page_content="bar")
 
     async def test_amax_marginal_relevance_search_vector_score(self, vs):
-        embedding = embeddings_service.embed_query("bar")
-        results = await vs.amax_marginal_relevance_search_with_score_by_vector(
-            embedding
-        )
-        assert results[0][0] == Document(page_content="bar")
-
-        results = await vs.amax_marginal_relevance_search_with_score_by_vector(
-            embedding, lambda_mult=0.75, fetch_k=10
+        embedding = BAR_EMBEDDING
+        results, tuned_results = await asyncio.gather(
+            vs.amax_marginal_relevance_search_with_score_by_vector(embedding),
+            vs.amax_marginal_relevance_search_with_score_by_vector(
+                embedding, lambda_mult=0.75, fetch_k=10
+            ),
         )
         assert results[0][0] == Document(page_content="bar")
+        assert tuned_results[0][0] == Document(page_content="bar")
 
 
 class TestVectorStoreSearchSync:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
-
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
-
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for AlloyDB")
-
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "instance for AlloyDB")
-
-    @pytest_asyncio.fixture(scope="class")
-    async def engine_sync(
-        self, db_project, db_region, db_cluster, db_instance, db_name
-    ):
-        engine = await AlloyDBEngine.afrom_instance(
-            project_id=db_project,
-            cluster=db_cluster,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
-        )
-        yield engine
-        await aexecute(engine, f"DROP TABLE IF EXISTS {DEFAULT_TABLE_SYNC}")
-        await engine.close()
-
-    @pytest_asyncio.fixture(scope="class")
-    async def vs_custom(self, engine_sync):
-        engine_sync.init_vectorstore_table(
-            DEFAULT_TABLE_SYNC,
-            VECTOR_SIZE,
-            id_column="myid",
-            content_column="mycontent",
-            embedding_column="myembedding",
-            metadata_columns=[
-                Column("page", "TEXT"),
-                Column("source", "TEXT"),
-            ],
-            store_metadata=False,
-        )
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
+    async def engine_sync(self, shared_engine):
+        yield shared_engine
+        await aexecute(shared_engine, f"DROP TABLE IF EXISTS {IMAGE_TABLE_SYNC}")
 
-        vs_custom = await AlloyDBVectorStore.create(
-            engine_sync,
-            embedding_service=embeddings_service,
-            table_name=DEFAULT_TABLE_SYNC,
-            id_column="myid",
-            content_column="mycontent",
-            embedding_column="myembedding",
-            index_query_options=HNSWQueryOptions(ef_search=1),
-        )
-        vs_custom.add_documents(docs, ids=ids)
-        yield vs_custom
-
-    @pytest_asyncio.fixture(scope="class")
-    async def image_uris(self):
-        red_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_red.jpg"
-        green_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_green.jpg"
-        blue_uri = str(uuid.uuid4()).replace("-", "_") + "test_image_blue.jpg"
-        image = Image.new("RGB", (100, 100), color="red")
-        image.save(red_uri)
-        image = Image.new("RGB", (100, 100), color="green")
-        image.save(green_uri)
-        image = Image.new("RGB", (100, 100), color="blue")
-        image.save(blue_uri)
-        image_uris = [red_uri, green_uri, blue_uri]
-        yield image_uris
-        for uri in image_uris:
-            os.remove(uri)
-
-    @pytest_asyncio.fixture(scope="class")
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
     def image_vs(self, engine_sync, image_uris):
         engine_sync.init_vectorstore_table(IMAGE_TABLE_SYNC, VECTOR_SIZE)
         vs = AlloyDBVectorStore.create_sync(
@@ -381,8 +240,10 @@ class TestVectorStoreSearchSync:
             table_name=IMAGE_TABLE_SYNC,
             distance_strategy=DistanceStrategy.COSINE_DISTANCE,
         )
-        ids = [str(uuid.uuid4()) for i in range(len(image_uris))]
-        vs.add_images(image_uris, ids=ids)
+        # Only the local images; the GCS one is covered by the async class.
+        local_uris = image_uris[:3]
+        ids = [uuid.uuid4().hex for _ in range(len(local_uris))]
+        vs.add_images(local_uris, ids=ids)
         yield vs
 
     def test_similarity_search(self, vs_custom):
@@ -404,7 +265,7 @@ class TestVectorStoreSearchSync:
         assert results[0][1] == 0
 
     def test_similarity_search_by_vector(self, vs_custom):
-        embedding = embeddings_service.embed_query("foo")
+        embedding = FOO_EMBEDDING
         results = vs_custom.similarity_search_by_vector(embedding)
         assert len(results) == 4
         assert results[0] == Document(page_content="foo")
@@ -421,12 +282,12 @@ class TestVectorStoreSearchSync:
         assert results[0] == Document(page_content="boo")
 
     def test_max_marginal_relevance_search_vector(self, vs_custom):
-        embedding = embeddings_service.embed_query("bar")
+        embedding = BAR_EMBEDDING
         results = vs_custom.max_marginal_relevance_search_by_vector(embedding)
         assert results[0] == Document(page_content="bar")
 
     def test_max_marginal_relevance_search_vector_score(self, vs_custom):
-        embedding = embeddings_service.embed_query("bar")
+        embedding = BAR_EMBEDDING
         results = vs_custom.max_marginal_relevance_search_with_score_by_vector(
             embedding
         )
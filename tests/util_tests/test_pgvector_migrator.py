@@ -14,9 +14,8 @@
 
 import asyncio
 import json
-import os
 import uuid
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Union
 from unittest import mock
 
 import pytest
@@ -38,20 +37,41 @@ from langchain_google_alloydb_pg.utils.pgvector_migrator import (
 COLLECTIONS_TABLE = "langchain_pg_collection"
 EMBEDDINGS_TABLE = "langchain_pg_embedding"
 VECTOR_SIZE = 768
-COLLECTION_NAME_SUFFIX = str(uuid.uuid4()).replace("-", "_")
-EMBEDDINGS_TABLE_COUNT_QUERY = (
-    f"SELECT COUNT(*) FROM {EMBEDDINGS_TABLE} WHERE collection_id=:collection_id"
-)
-COLLECTION_TABLE_ENTRY_QUERY = (
-    f"SELECT COUNT(*) FROM {COLLECTIONS_TABLE} WHERE uuid=:collection_id"
-)
+SAMPLE_EMBEDDINGS = [0.1] * (VECTOR_SIZE - 1) + [0.2]
+# pgvector's text form of SAMPLE_EMBEDDINGS, as the migrated rows return it
+SAMPLE_EMBEDDINGS_STR = str(SAMPLE_EMBEDDINGS).replace(" ", "")
+# Kept short: collection names are reused in table and metadata column names,
+# which Postgres truncates at 63 characters
+COLLECTION_NAME_SUFFIX = uuid.uuid4().hex[:8]
+# Migration tests move the first collection into one of these tables
+MIGRATED_TABLE = f"collection_0_{COLLECTION_NAME_SUFFIX}"
+METADATA_MIGRATED_TABLE = f"{MIGRATED_TABLE}_metadata"
+SYNC_MIGRATED_TABLE = f"{MIGRATED_TABLE}_sync"
+SYNC_METADATA_MIGRATED_TABLE = f"{METADATA_MIGRATED_TABLE}_sync"
+# Migrated from the first collection's metadata keys
+METADATA_COLUMNS = [
+    Column(f"col_0_{MIGRATED_TABLE}", "VARCHAR"),
+    Column(f"col_1_{MIGRATED_TABLE}", "VARCHAR"),
+]
 
 
 concurrent_batch_insert_method = __concurrent_batch_insert
 
 
+def migration_counts_query(table_name: str) -> str:
+    """Counts the migrated rows and the collection's remaining PGVector rows
+    in a single query."""
+    return (
+        f"SELECT (SELECT COUNT(*) FROM {table_name}) AS migrated, "
+        f"(SELECT COUNT(*) FROM {EMBEDDINGS_TABLE} WHERE collection_id = :collection_id) AS embeddings, "
+        f"(SELECT COUNT(*) FROM {COLLECTIONS_TABLE} WHERE uuid = :collection_id) AS collections"
+    )
+
+
 async def aexecute(
-    engine: AlloyDBEngine, query: str, params: Optional[dict] = None
+    engine: AlloyDBEngine,
+    query: str,
+    params: Optional[Union[dict, list[dict]]] = None,
 ) -> None:
     async def run(engine, query, params):
         async with engine._pool.connect() as conn:
@@ -61,6 +81,21 @@ async def aexecute(
     await engine._run_as_async(run(engine, query, params))
 
 
+async def aexecute_many(
+    engine: AlloyDBEngine,
+    statements: Sequence[tuple[str, Optional[Union[dict, list[dict]]]]],
+) -> None:
+    """Runs all statements on one connection and commits them together."""
+
+    async def run(engine, statements):
+        async with engine._pool.connect() as conn:
+            for query, params in statements:
+                await conn.execute(text(query), params)
+            await conn.commit()
+
+    await engine._run_as_async(run(engine, statements))
+
+
 async def afetch(
     engine: AlloyDBEngine, query: str, params: Optional[dict] = None
 ) -> Sequence[RowMapping]:
@@ -74,85 +109,90 @@ async def afetch(
     return await engine._run_as_async(run(engine, query, params))
 
 
-def get_env_var(key: str, desc: str) -> str:
-    v = os.environ.get(key)
-    if v is None:
-        raise ValueError(f"Must set env var {key} to: {desc}")
-    return v
+async def _afetch_migration_results(
+    engine: AlloyDBEngine, collection_name: str, table_name: str, select_cols: str
+) -> tuple[Sequence[RowMapping], Sequence[RowMapping]]:
+    """Fetches the migration counts and the collection's first migrated row.
+
+    The two checks are independent reads, so they run concurrently.
+    """
+    return await asyncio.gather(
+        afetch(
+            engine,
+            migration_counts_query(table_name),
+            params={"collection_id": f"collection_id_{collection_name}"},
+        ),
+        afetch(
+            engine,
+            f"SELECT {select_cols} FROM {table_name} WHERE langchain_id = :id",
+            params={"id": f"uuid_0_{collection_name}"},
+        ),
+    )
 
 
 @pytest.mark.asyncio
-class TestPgvectorengine:
-    @pytest.fixture(scope="module")
-    def db_project(self) -> str:
-        return get_env_var("PROJECT_ID", "project id for google cloud")
+async def test_concurrent_batch_insert_concurrency():
+    max_concurrency = 5
+    data_batches = mock.AsyncMock()
+    data_batches.__aiter__.return_value = [
+        [
+            mock.Mock(
+                document=f"doc{i}",
+                embedding=[i],
+                cmetadata={"meta": f"data{i}"},
+                id=f"id{i}",
+            )
+        ]
+        for i in range(10)  # 10 batches
+    ]
+    vector_store = mock.AsyncMock()
 
-    @pytest.fixture(scope="module")
-    def db_region(self) -> str:
-        return get_env_var("REGION", "region for AlloyDB instance")
+    async def delayed_aadd_embeddings(*args, **kwargs):
+        await asyncio.sleep(0.1)  # Simulate a small delay
 
-    @pytest.fixture(scope="module")
-    def db_cluster(self) -> str:
-        return get_env_var("CLUSTER_ID", "cluster for AlloyDB instance")
+    vector_store.aadd_embeddings.side_effect = delayed_aadd_embeddings
 
-    @pytest.fixture(scope="module")
-    def db_instance(self) -> str:
-        return get_env_var("INSTANCE_ID", "instance for alloydb")
+    concurrent_tasks = set()
 
-    @pytest.fixture(scope="module")
-    def db_name(self) -> str:
-        return get_env_var("DATABASE_ID", "database name for AlloyDB")
+    async def track_concurrency(*args, **kwargs):
+        concurrent_tasks.add(asyncio.current_task())
+        assert len(concurrent_tasks) <= max_concurrency
+        try:
+            return await delayed_aadd_embeddings(*args, **kwargs)
+        finally:
+            concurrent_tasks.remove(asyncio.current_task())
 
-    @pytest.fixture(scope="module")
-    def user(self) -> str:
-        return get_env_var("DB_USER", "user for AlloyDB")
+    vector_store.aadd_embeddings.side_effect = track_concurrency
 
-    @pytest.fixture(scope="module")
-    def password(self) -> str:
-        return get_env_var("DB_PASSWORD", "password for AlloyDB")
+    await concurrent_batch_insert_method(
+        data_batches, vector_store, max_concurrency=max_concurrency
+    )
 
-    @pytest.fixture(scope="module")
-    def iam_account(self) -> str:
-        return get_env_var("IAM_ACCOUNT", "Cloud SQL IAM account email")
 
-    @pytest_asyncio.fixture(scope="module", params=["PUBLIC"])
-    async def engine(
-        self,
-        request,
-        db_project,
-        db_region,
-        db_cluster,
-        db_instance,
-        db_name,
-        user,
-        password,
-    ):
-        engine = AlloyDBEngine.from_instance(
-            project_id=db_project,
-            instance=db_instance,
-            region=db_region,
-            database=db_name,
-            cluster=db_cluster,
-            ip_type=request.param,
-            user=user,
-            password=password,
-        )
-        await aexecute(
-            engine,
-            query=f"CREATE table {COLLECTIONS_TABLE} (uuid VARCHAR, name VARCHAR, cmetadata JSONB)",
-        )
-        await aexecute(
+@pytest.mark.asyncio
+class TestPgvectorengine:
+    @pytest_asyncio.fixture(scope="module")
+    async def engine(self, shared_engine):
+        engine = shared_engine
+        await aexecute_many(
             engine,
-            query=f"CREATE table {EMBEDDINGS_TABLE} (id VARCHAR, collection_id VARCHAR, embedding vector(768), document TEXT, cmetadata JSONB)",
+            [
+                (
+                    f"CREATE table {COLLECTIONS_TABLE} (uuid VARCHAR, name VARCHAR, cmetadata JSONB)",
+                    None,
+                ),
+                (
+                    f"CREATE table {EMBEDDINGS_TABLE} (id VARCHAR, collection_id VARCHAR, embedding vector(768), document TEXT, cmetadata JSONB)",
+                    None,
+                ),
+            ],
         )
         yield engine
-        await aexecute(engine, f"DROP TABLE {COLLECTIONS_TABLE}")
-        await aexecute(engine, f"DROP TABLE {EMBEDDINGS_TABLE}")
-        await engine.close()
+        await aexecute(engine, f"DROP TABLE {COLLECTIONS_TABLE}, {EMBEDDINGS_TABLE}")
 
     @pytest.fixture(scope="module")
     def sample_embeddings(self) -> list[float]:
-        return [0.1] * (VECTOR_SIZE - 1) + [0.2]
+        return SAMPLE_EMBEDDINGS
 
     def _create_metadata_for_collection(
         self, collection_name: str, row_num: int, num_cols: int = 3
@@ -164,36 +204,29 @@ class TestPgvectorengine:
             )
         return metadata
 
-    async def _create_collection(
+    def _create_embedding_rows(
         self,
-        engine: AlloyDBEngine,
         collection_name: str,
         sample_embeddings: list[float],
         num_rows: int = 2,
         num_cols: int = 3,
-    ) -> None:
+    ) -> list[dict]:
         collection_id = f"collection_id_{collection_name}"
-        await aexecute(
-            engine,
-            query=f"INSERT INTO {COLLECTIONS_TABLE} (uuid, name) VALUES (:uuid, :collection_name)",
-            params={"uuid": collection_id, "collection_name": collection_name},
-        )
-        for row_num in range(num_rows):
-            await aexecute(
-                engine,
-                query=f"""INSERT INTO {EMBEDDINGS_TABLE} (id, collection_id, embedding, document, cmetadata) VALUES (:id, :collection_id, :embedding, :document, :cmetadata)""",
-                params={
-                    "collection_id": collection_id,
-                    "id": f"uuid_{row_num}_{collection_name}",
-                    "embedding": str(sample_embeddings),
-                    "document": f"content_{row_num}",
-                    "cmetadata": json.dumps(
-                        self._create_metadata_for_collection(
-                            collection_name, row_num=row_num, num_cols=num_cols
-                        )
-                    ),
-                },
-            )
+        embedding = str(sample_embeddings)
+        return [
+            {
+                "collection_id": collection_id,
+                "id": f"uuid_{row_num}_{collection_name}",
+                "embedding": embedding,
+                "document": f"content_{row_num}",
+                "cmetadata": json.dumps(
+                    self._create_metadata_for_collection(
+                        collection_name, row_num=row_num, num_cols=num_cols
+                    )
+                ),
+            }
+            for row_num in range(num_rows)
+        ]
 
     async def _create_pgvector_tables(
         self,
@@ -204,15 +237,38 @@ class TestPgvectorengine:
         num_cols: int = 3,
     ) -> None:
         """Create embeddings as well as collections table."""
+        collections = []
+        embeddings = []
         for collection_num in range(num_collections):
             collection_name = f"collection_{collection_num}_{COLLECTION_NAME_SUFFIX}"
-            await self._create_collection(
-                engine,
-                collection_name,
-                sample_embeddings,
-                num_rows=num_rows,
-                num_cols=num_cols,
+            collections.append(
+                {
+                    "uuid": f"collection_id_{collection_name}",
+                    "collection_name": collection_name,
+                }
+            )
+            embeddings.extend(
+                self._create_embedding_rows(
+                    collection_name,
+                    sample_embeddings,
+                    num_rows=num_rows,
+                    num_cols=num_cols,
+                )
             )
+        # Each list of params runs as a single executemany
+        await aexecute_many(
+            engine,
+            [
+                (
+                    f"INSERT INTO {COLLECTIONS_TABLE} (uuid, name) VALUES (:uuid, :collection_name)",
+                    collections,
+                ),
+                (
+                    f"""INSERT INTO {EMBEDDINGS_TABLE} (id, collection_id, embedding, document, cmetadata) VALUES (:id, :collection_id, :embedding, :document, :cmetadata)""",
+                    embeddings,
+                ),
+            ],
+        )
 
     async def _collect_async_items(self, batch_docs_generator):
         """Collects items from an async generator."""
@@ -228,48 +284,83 @@ class TestPgvectorengine:
             docs.extend(doc)
         return docs
 
-    async def _clean_tables(self, engine):
-        await aexecute(engine, f"TRUNCATE TABLE {EMBEDDINGS_TABLE}")
-        await aexecute(engine, f"TRUNCATE TABLE {COLLECTIONS_TABLE}")
-
-    @pytest.mark.asyncio
-    async def test_concurrent_batch_insert_concurrency(self):
-        max_concurrency = 5
-        data_batches = mock.AsyncMock()
-        data_batches.__aiter__.return_value = [
-            [
-                mock.Mock(
-                    document=f"doc{i}",
-                    embedding=[i],
-                    cmetadata={"meta": f"data{i}"},
-                    id=f"id{i}",
-                )
-            ]
-            for i in range(10)  # 10 batches
-        ]
-        vector_store = mock.AsyncMock()
-
-        async def delayed_aadd_embeddings(*args, **kwargs):
-            await asyncio.sleep(0.1)  # Simulate a small delay
-
-        vector_store.aadd_embeddings.side_effect = delayed_aadd_embeddings
-
-        concurrent_tasks = set()
+    @pytest_asyncio.fixture(scope="class")
+    async def migrated_tables(self, engine):
+        # Migration target tables live for the whole class and are dropped
+        # together at teardown.
+        tables: list[str] = []
+        yield tables
+        if tables:
+            await aexecute(engine, f"DROP TABLE IF EXISTS {', '.join(tables)}")
+
+    @pytest_asyncio.fixture(scope="class")
+    async def vector_store(self, engine, migrated_tables):
+        await engine.ainit_vectorstore_table(
+            table_name=MIGRATED_TABLE,
+            vector_size=VECTOR_SIZE,
+            id_column=Column("langchain_id", "VARCHAR"),
+        )
+        migrated_tables.append(MIGRATED_TABLE)
+        yield await AlloyDBVectorStore.create(
+            engine,
+            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
+            table_name=MIGRATED_TABLE,
+        )
 
-        async def track_concurrency(*args, **kwargs):
-            concurrent_tasks.add(asyncio.current_task())
-            assert len(concurrent_tasks) <= max_concurrency
-            try:
-                return await delayed_aadd_embeddings(*args, **kwargs)
-            finally:
-                concurrent_tasks.remove(asyncio.current_task())
+    @pytest_asyncio.fixture(scope="class")
+    async def metadata_vector_store(self, engine, migrated_tables):
+        await engine.ainit_vectorstore_table(
+            table_name=METADATA_MIGRATED_TABLE,
+            vector_size=VECTOR_SIZE,
+            metadata_columns=METADATA_COLUMNS,
+            id_column=Column("langchain_id", "VARCHAR"),
+        )
+        migrated_tables.append(METADATA_MIGRATED_TABLE)
+        yield await AlloyDBVectorStore.create(
+            engine,
+            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
+            table_name=METADATA_MIGRATED_TABLE,
+            metadata_columns=[col.name for col in METADATA_COLUMNS],
+        )
 
-        vector_store.aadd_embeddings.side_effect = track_concurrency
+    @pytest.fixture(scope="class")
+    def sync_vector_store(self, engine, migrated_tables):
+        engine.init_vectorstore_table(
+            table_name=SYNC_MIGRATED_TABLE,
+            vector_size=VECTOR_SIZE,
+            id_column=Column("langchain_id", "VARCHAR"),
+        )
+        migrated_tables.append(SYNC_MIGRATED_TABLE)
+        return AlloyDBVectorStore.create_sync(
+            engine,
+            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
+            table_name=SYNC_MIGRATED_TABLE,
+        )
 
-        await concurrent_batch_insert_method(
-            data_batches, vector_store, max_concurrency=max_concurrency
+    @pytest.fixture(scope="class")
+    def sync_metadata_vector_store(self, engine, migrated_tables):
+        engine.init_vectorstore_table(
+            table_name=SYNC_METADATA_MIGRATED_TABLE,
+            vector_size=VECTOR_SIZE,
+            metadata_columns=METADATA_COLUMNS,
+            id_column=Column("langchain_id", "VARCHAR"),
+        )
+        migrated_tables.append(SYNC_METADATA_MIGRATED_TABLE)
+        return AlloyDBVectorStore.create_sync(
+            engine,
+            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
+            table_name=SYNC_METADATA_MIGRATED_TABLE,
+            metadata_columns=[col.name for col in METADATA_COLUMNS],
         )
 
+    @pytest_asyncio.fixture(autouse=True)
+    async def clean_tables(self, engine, migrated_tables):
+        # Empty the pgvector tables and every migration target created so far
+        # after each test, including failed ones, in a single statement.
+        yield
+        tables = ", ".join([COLLECTIONS_TABLE, EMBEDDINGS_TABLE, *migrated_tables])
+        await aexecute(engine, f"TRUNCATE TABLE {tables}")
+
     #### Async tests
     async def test_aextract_pgvector_collection_exists(self, engine, sample_embeddings):
         await self._create_pgvector_tables(engine, sample_embeddings)
@@ -281,7 +372,7 @@ class TestPgvectorengine:
             {
                 "id": f"uuid_0_{collection_name}",
                 "collection_id": f"collection_id_{collection_name}",
-                "embedding": str(sample_embeddings).replace(" ", ""),
+                "embedding": SAMPLE_EMBEDDINGS_STR,
                 "document": "content_0",
                 "cmetadata": self._create_metadata_for_collection(
                     collection_name, row_num=0, num_cols=3
@@ -290,18 +381,16 @@ class TestPgvectorengine:
             {
                 "id": f"uuid_1_{collection_name}",
                 "collection_id": f"collection_id_{collection_name}",
-                "embedding": str(sample_embeddings).replace(" ", ""),
+                "embedding": SAMPLE_EMBEDDINGS_STR,
                 "document": "content_1",
                 "cmetadata": self._create_metadata_for_collection(
                     collection_name, row_num=1, num_cols=3
                 ),
             },
         ]
-        for row in results:
-            assert row in expected
+        expected_by_id = {row["id"]: row for row in expected}
         assert len(results) == 2
-
-        await self._clean_tables(engine)
+        assert {row["id"]: dict(row) for row in results} == expected_by_id
 
     async def test_aextract_pgvector_collection_non_existant(self, engine):
         collection_name = "random_collection"
@@ -309,156 +398,83 @@ class TestPgvectorengine:
             await self._collect_async_items(
                 aextract_pgvector_collection(engine, collection_name)
             )
-        await self._clean_tables(engine)
 
     async def test_amigrate_pgvector_collection_json_metadata(
-        self, engine, sample_embeddings
+        self, engine, sample_embeddings, vector_store
     ):
         # Set up tables
         await self._create_pgvector_tables(engine, sample_embeddings, num_rows=5)
         collection_name = f"collection_0_{COLLECTION_NAME_SUFFIX}"
-        await engine.ainit_vectorstore_table(
-            table_name=collection_name,
-            vector_size=VECTOR_SIZE,
-            id_column=Column("langchain_id", "VARCHAR"),
-        )
-        vector_store = await AlloyDBVectorStore.create(
-            engine,
-            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
-            table_name=collection_name,
-        )
         await amigrate_pgvector_collection(
             engine,
             collection_name=collection_name,
             vector_store=vector_store,
         )
 
-        # Check that all data has been migrated
-        migrated_table_count = await afetch(
-            engine, f"SELECT COUNT(*) FROM {collection_name}"
+        counts, migrated_data = await _afetch_migration_results(
+            engine,
+            collection_name,
+            collection_name,
+            "langchain_id, content, embedding, langchain_metadata",
         )
-        assert migrated_table_count == [{"count": 5}]
+
+        # Check that all data has been migrated, and that the collection data
+        # was not deleted from either PGVector table
+        assert counts == [{"migrated": 5, "embeddings": 5, "collections": 1}]
 
         # Check one row to ensure that the data is inserted correctly
-        migrated_data = await afetch(
-            engine,
-            f"SELECT langchain_id, content, embedding, langchain_metadata FROM {collection_name} LIMIT 1",
-        )
         expected_row = {
             "langchain_id": f"uuid_0_{collection_name}",
             "content": "content_0",
-            "embedding": str(sample_embeddings).replace(" ", ""),
+            "embedding": SAMPLE_EMBEDDINGS_STR,
             "langchain_metadata": self._create_metadata_for_collection(
                 collection_name, 0, num_cols=3
             ),
         }
-        assert expected_row in migrated_data
-
-        # The collection data should not be deleted from both PGVector tables
-        collection_id = f"collection_id_{collection_name}"
-        embeddings_table_count = await afetch(
-            engine,
-            EMBEDDINGS_TABLE_COUNT_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert embeddings_table_count == [{"count": 5}]
-        collection_table_entry = await afetch(
-            engine,
-            COLLECTION_TABLE_ENTRY_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert collection_table_entry == [{"count": 1}]
-
-        # Delete set up tables
-        await self._clean_tables(engine)
-        await aexecute(engine, f"DROP TABLE {collection_name}")
+        assert migrated_data == [expected_row]
 
     async def test_amigrate_pgvector_collection_col_metadata(
-        self, engine, sample_embeddings
+        self, engine, sample_embeddings, metadata_vector_store
     ):
         # Set up tables
         await self._create_pgvector_tables(engine, sample_embeddings, num_rows=5)
         collection_name = f"collection_0_{COLLECTION_NAME_SUFFIX}"
-        metadata_columns = [
-            Column(f"col_0_{collection_name}", "VARCHAR"),
-            Column(f"col_1_{collection_name}", "VARCHAR"),
-        ]
-        await engine.ainit_vectorstore_table(
-            table_name=collection_name,
-            vector_size=VECTOR_SIZE,
-            metadata_columns=metadata_columns,
-            id_column=Column("langchain_id", "VARCHAR"),
-        )
-        vector_store = await AlloyDBVectorStore.create(
-            engine,
-            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
-            table_name=collection_name,
-            metadata_columns=[col.name for col in metadata_columns],
-        )
         await amigrate_pgvector_collection(
             engine,
             collection_name=collection_name,
-            vector_store=vector_store,
+            vector_store=metadata_vector_store,
         )
 
-        # Check that all data has been migrated
-        migrated_table_count = await afetch(
-            engine, f"SELECT COUNT(*) FROM {collection_name}"
+        counts, migrated_data = await _afetch_migration_results(
+            engine,
+            collection_name,
+            METADATA_MIGRATED_TABLE,
+            f"langchain_id, content, embedding, col_0_{collection_name}, col_1_{collection_name}, langchain_metadata",
         )
-        assert migrated_table_count == [{"count": 5}]
+
+        # Check that all data has been migrated, and that the collection data
+        # was not deleted from either PGVector table
+        assert counts == [{"migrated": 5, "embeddings": 5, "collections": 1}]
 
         # Check one row to ensure that the data is inserted correctly
-        migrated_data = await afetch(
-            engine,
-            f"SELECT langchain_id, content, embedding, col_0_{collection_name}, col_1_{collection_name}, langchain_metadata FROM {collection_name} LIMIT 1",
-        )
         expected_row = {
             "langchain_id": f"uuid_0_{collection_name}",
             "content": "content_0",
-            "embedding": str(sample_embeddings).replace(" ", ""),
+            "embedding": SAMPLE_EMBEDDINGS_STR,
             f"col_0_{collection_name}": f"val_0_{collection_name}",
             f"col_1_{collection_name}": f"val_0_{collection_name}",
             "langchain_metadata": {
                 f"col_2_{collection_name}": f"val_0_{collection_name}"
             },
         }
-        assert expected_row in migrated_data
-
-        # The collection data should not be deleted from both PGVector tables
-        collection_id = f"collection_id_{collection_name}"
-        embeddings_table_count = await afetch(
-            engine,
-            EMBEDDINGS_TABLE_COUNT_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert embeddings_table_count == [{"count": 5}]
-        collection_table_entry = await afetch(
-            engine,
-            COLLECTION_TABLE_ENTRY_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert collection_table_entry == [{"count": 1}]
-
-        # Delete set up tables
-        await self._clean_tables(engine)
-        await aexecute(engine, f"DROP TABLE {collection_name}")
+        assert migrated_data == [expected_row]
 
     async def test_amigrate_pgvector_collection_delete_original(
-        self, engine, sample_embeddings
+        self, engine, sample_embeddings, vector_store
     ):
         # Set up tables
         await self._create_pgvector_tables(engine, sample_embeddings, num_rows=5)
         collection_name = f"collection_0_{COLLECTION_NAME_SUFFIX}"
-        await engine.ainit_vectorstore_table(
-            table_name=collection_name,
-            vector_size=VECTOR_SIZE,
-            id_column=Column("langchain_id", "VARCHAR"),
-        )
-        vector_store = await AlloyDBVectorStore.create(
-            engine,
-            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
-            table_name=collection_name,
-        )
         await amigrate_pgvector_collection(
             engine,
             collection_name=collection_name,
@@ -466,60 +482,34 @@ class TestPgvectorengine:
             delete_pg_collection=True,
         )
 
-        # Check that all data has been migrated
-        migrated_table_count = await afetch(
-            engine, f"SELECT COUNT(*) FROM {collection_name}"
+        counts, migrated_data = await _afetch_migration_results(
+            engine,
+            collection_name,
+            collection_name,
+            "langchain_id, content, embedding, langchain_metadata",
         )
-        assert migrated_table_count == [{"count": 5}]
+
+        # Check that all data has been migrated, and that the collection data
+        # was deleted from both PGVector tables
+        assert counts == [{"migrated": 5, "embeddings": 0, "collections": 0}]
 
         # Check one row to ensure that the data is inserted correctly
-        migrated_data = await afetch(
-            engine,
-            f"SELECT langchain_id, content, embedding, langchain_metadata FROM {collection_name} LIMIT 1",
-        )
         expected_row = {
             "langchain_id": f"uuid_0_{collection_name}",
             "content": "content_0",
-            "embedding": str(sample_embeddings).replace(" ", ""),
+            "embedding": SAMPLE_EMBEDDINGS_STR,
             "langchain_metadata": self._create_metadata_for_collection(
                 collection_name, 0, num_cols=3
             ),
         }
-        assert expected_row in migrated_data
+        assert migrated_data == [expected_row]
 
-        # The collection data should be deleted from both PGVector tables
-        collection_id = f"collection_id_{collection_name}"
-        embeddings_table_count = await afetch(
-            engine,
-            EMBEDDINGS_TABLE_COUNT_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert embeddings_table_count == [{"count": 0}]
-        collection_table_entry = await afetch(
-            engine,
-            f"SELECT COUNT(*) FROM {COLLECTIONS_TABLE} WHERE uuid = :collection_id",
-            params={"collection_id": collection_id},
-        )
-        assert collection_table_entry == [{"count": 0}]
-
-        # Delete set up tables
-        await self._clean_tables(engine)
-        await aexecute(engine, f"DROP TABLE {collection_name}")
-
-    async def test_amigrate_pgvector_collection_batch(self, engine, sample_embeddings):
+    async def test_amigrate_pgvector_collection_batch(
+        self, engine, sample_embeddings, vector_store
+    ):
         # Set up tables
         await self._create_pgvector_tables(engine, sample_embeddings, num_rows=7)
         collection_name = f"collection_0_{COLLECTION_NAME_SUFFIX}"
-        await engine.ainit_vectorstore_table(
-            table_name=collection_name,
-            vector_size=VECTOR_SIZE,
-            id_column=Column("langchain_id", "VARCHAR"),
-        )
-        vector_store = await AlloyDBVectorStore.create(
-            engine,
-            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
-            table_name=collection_name,
-        )
         await amigrate_pgvector_collection(
             engine,
             collection_name=collection_name,
@@ -536,21 +526,18 @@ class TestPgvectorengine:
         # Check last row to ensure that the data is inserted correctly
         migrated_data = await afetch(
             engine,
-            f"SELECT langchain_id, content, embedding, langchain_metadata FROM {collection_name}",
+            f"SELECT langchain_id, content, embedding, langchain_metadata FROM {collection_name} WHERE langchain_id = :id",
+            params={"id": f"uuid_6_{collection_name}"},
         )
         expected_row = {
             "langchain_id": f"uuid_6_{collection_name}",
             "content": "content_6",
-            "embedding": str(sample_embeddings).replace(" ", ""),
+            "embedding": SAMPLE_EMBEDDINGS_STR,
             "langchain_metadata": self._create_metadata_for_collection(
                 collection_name, 6, num_cols=3
             ),
         }
-        assert expected_row in migrated_data
-
-        # Delete set up tables
-        await self._clean_tables(engine)
-        await aexecute(engine, f"DROP TABLE {collection_name}")
+        assert migrated_data == [expected_row]
 
     async def test_alist_pgvector_collection_names(self, engine, sample_embeddings):
         num_collections = 3
@@ -560,26 +547,29 @@ class TestPgvectorengine:
         all_collections = await alist_pgvector_collection_names(engine)
         assert len(all_collections) == num_collections
 
-        expected = [
+        expected = {
             f"collection_{i}_{COLLECTION_NAME_SUFFIX}" for i in range(num_collections)
-        ]
-        for collection in all_collections:
-            assert collection in expected
-
-        await self._clean_tables(engine)
+        }
+        assert set(all_collections) == expected
 
     async def test_alist_pgvector_collection_names_error(self, engine):
-        await aexecute(engine, f"DROP TABLE IF EXISTS {COLLECTIONS_TABLE}")
-        await aexecute(engine, f"DROP TABLE IF EXISTS {EMBEDDINGS_TABLE}")
-        with pytest.raises(ValueError):
-            await alist_pgvector_collection_names(engine)
         await aexecute(
-            engine,
-            query=f"CREATE table {COLLECTIONS_TABLE} (uuid VARCHAR, name VARCHAR, cmetadata JSONB)",
+            engine, f"DROP TABLE IF EXISTS {COLLECTIONS_TABLE}, {EMBEDDINGS_TABLE}"
         )
-        await aexecute(
+        with pytest.raises(ValueError):
+            await alist_pgvector_collection_names(engine)
+        await aexecute_many(
             engine,
-            query=f"CREATE table {EMBEDDINGS_TABLE} (id VARCHAR, collection_id VARCHAR, embedding vector(768), document TEXT, cmetadata JSONB)",
+            [
+                (
+                    f"CREATE table {COLLECTIONS_TABLE} (uuid VARCHAR, name VARCHAR, cmetadata JSONB)",
+                    None,
+                ),
+                (
+                    f"CREATE table {EMBEDDINGS_TABLE} (id VARCHAR, collection_id VARCHAR, embedding vector(768), document TEXT, cmetadata JSONB)",
+                    None,
+                ),
+            ],
         )
 
     #### Sync tests
@@ -593,7 +583,7 @@ class TestPgvectorengine:
             {
                 "id": f"uuid_0_{collection_name}",
                 "collection_id": f"collection_id_{collection_name}",
-                "embedding": str(sample_embeddings).replace(" ", ""),
+                "embedding": SAMPLE_EMBEDDINGS_STR,
                 "document": "content_0",
                 "cmetadata": self._create_metadata_for_collection(
                     collection_name, row_num=0, num_cols=3
@@ -602,18 +592,16 @@ class TestPgvectorengine:
             {
                 "id": f"uuid_1_{collection_name}",
                 "collection_id": f"collection_id_{collection_name}",
-                "embedding": str(sample_embeddings).replace(" ", ""),
+                "embedding": SAMPLE_EMBEDDINGS_STR,
                 "document": "content_1",
                 "cmetadata": self._create_metadata_for_collection(
                     collection_name, row_num=1, num_cols=3
                 ),
             },
         ]
-        for row in results:
-            assert row in expected
+        expected_by_id = {row["id"]: row for row in expected}
         assert len(results) == 2
-
-        await self._clean_tables(engine)
+        assert {row["id"]: dict(row) for row in results} == expected_by_id
 
     async def test_extract_pgvector_collection_non_existant(self, engine):
         collection_name = "random_collection"
@@ -621,249 +609,146 @@ class TestPgvectorengine:
             self._collect_sync_items(
                 extract_pgvector_collection(engine, collection_name)
             )
-        await self._clean_tables(engine)
 
     async def test_migrate_pgvector_collection_json_metadata(
-        self, engine, sample_embeddings
+        self, engine, sample_embeddings, sync_vector_store
     ):
         # Set up tables
         await self._create_pgvector_tables(engine, sample_embeddings, num_rows=5)
         collection_name = f"collection_0_{COLLECTION_NAME_SUFFIX}"
-
-        engine.init_vectorstore_table(
-            table_name=collection_name,
-            vector_size=VECTOR_SIZE,
-            id_column=Column("langchain_id", "VARCHAR"),
-        )
-        vector_store = AlloyDBVectorStore.create_sync(
-            engine,
-            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
-            table_name=collection_name,
-        )
         migrate_pgvector_collection(
             engine,
             collection_name=collection_name,
-            vector_store=vector_store,
+            vector_store=sync_vector_store,
         )
 
-        # Check that all data has been migrated
-        migrated_table_count = await afetch(
-            engine, f"SELECT COUNT(*) FROM {collection_name}"
+        counts, migrated_data = await _afetch_migration_results(
+            engine,
+            collection_name,
+            SYNC_MIGRATED_TABLE,
+            "langchain_id, content, embedding, langchain_metadata",
         )
-        assert migrated_table_count == [{"count": 5}]
+
+        # Check that all data has been migrated, and that the collection data
+        # was not deleted from either PGVector table
+        assert counts == [{"migrated": 5, "embeddings": 5, "collections": 1}]
 
         # Check one row to ensure that the data is inserted correctly
-        migrated_data = await afetch(
-            engine,
-            f"SELECT langchain_id, content, embedding, langchain_metadata FROM {collection_name} LIMIT 1",
-        )
         expected_row = {
             "langchain_id": f"uuid_0_{collection_name}",
             "content": "content_0",
-            "embedding": str(sample_embeddings).replace(" ", ""),
+            "embedding": SAMPLE_EMBEDDINGS_STR,
             "langchain_metadata": self._create_metadata_for_collection(
                 collection_name, 0, num_cols=3
             ),
         }
-        assert expected_row in migrated_data
-
-        # The collection data should not be deleted from both PGVector tables
-        collection_id = f"collection_id_{collection_name}"
-        embeddings_table_count = await afetch(
-            engine,
-            EMBEDDINGS_TABLE_COUNT_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert embeddings_table_count == [{"count": 5}]
-        collection_table_entry = await afetch(
-            engine,
-            COLLECTION_TABLE_ENTRY_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert collection_table_entry == [{"count": 1}]
-
-        # Delete set up tables
-        await self._clean_tables(engine)
-        await aexecute(engine, f"DROP TABLE {collection_name}")
+        assert migrated_data == [expected_row]
 
     async def test_migrate_pgvector_collection_col_metadata(
-        self, engine, sample_embeddings
+        self, engine, sample_embeddings, sync_metadata_vector_store
     ):
         # Set up tables
         await self._create_pgvector_tables(engine, sample_embeddings, num_rows=5)
         collection_name = f"collection_0_{COLLECTION_NAME_SUFFIX}"
-        metadata_columns = [
-            Column(f"col_0_{collection_name}", "VARCHAR"),
-            Column(f"col_1_{collection_name}", "VARCHAR"),
-        ]
-        engine.init_vectorstore_table(
-            table_name=collection_name,
-            vector_size=VECTOR_SIZE,
-            metadata_columns=metadata_columns,
-            id_column=Column("langchain_id", "VARCHAR"),
-        )
-        vector_store = AlloyDBVectorStore.create_sync(
-            engine,
-            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
-            table_name=collection_name,
-            metadata_columns=[col.name for col in metadata_columns],
-        )
         migrate_pgvector_collection(
             engine,
             collection_name=collection_name,
-            vector_store=vector_store,
+            vector_store=sync_metadata_vector_store,
         )
 
-        # Check that all data has been migrated
-        migrated_table_count = await afetch(
-            engine, f"SELECT COUNT(*) FROM {collection_name}"
+        counts, migrated_data = await _afetch_migration_results(
+            engine,
+            collection_name,
+            SYNC_METADATA_MIGRATED_TABLE,
+            f"langchain_id, content, embedding, col_0_{collection_name}, col_1_{collection_name}, langchain_metadata",
         )
-        assert migrated_table_count == [{"count": 5}]
+
+        # Check that all data has been migrated, and that the collection data
+        # was not deleted from either PGVector table
+        assert counts == [{"migrated": 5, "embeddings": 5, "collections": 1}]
 
         # Check one row to ensure that the data is inserted correctly
-        migrated_data = await afetch(
-            engine,
-            f"SELECT langchain_id, content, embedding, col_0_{collection_name}, col_1_{collection_name}, langchain_metadata FROM {collection_name} LIMIT 1",
-        )
         expected_row = {
             "langchain_id": f"uuid_0_{collection_name}",
             "content": "content_0",
-            "embedding": str(sample_embeddings).replace(" ", ""),
+            "embedding": SAMPLE_EMBEDDINGS_STR,
             f"col_0_{collection_name}": f"val_0_{collection_name}",
             f"col_1_{collection_name}": f"val_0_{collection_name}",
             "langchain_metadata": {
                 f"col_2_{collection_name}": f"val_0_{collection_name}"
             },
         }
-        assert expected_row in migrated_data
-
-        # The collection data should not be deleted from both PGVector tables
-        collection_id = f"collection_id_{collection_name}"
-        embeddings_table_count = await afetch(
-            engine,
-            f"SELECT COUNT(*) FROM {EMBEDDINGS_TABLE} WHERE collection_id=:collection_id",
-            params={"collection_id": collection_id},
-        )
-        assert embeddings_table_count == [{"count": 5}]
-        collection_table_entry = await afetch(
-            engine,
-            COLLECTION_TABLE_ENTRY_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert collection_table_entry == [{"count": 1}]
-
-        # Delete set up tables
-        await self._clean_tables(engine)
-        await aexecute(engine, f"DROP TABLE {collection_name}")
+        assert migrated_data == [expected_row]
 
     async def test_migrate_pgvector_collection_delete_original(
-        self, engine, sample_embeddings
+        self, engine, sample_embeddings, sync_vector_store
     ):
         # Set up tables
         await self._create_pgvector_tables(engine, sample_embeddings, num_rows=5)
         collection_name = f"collection_0_{COLLECTION_NAME_SUFFIX}"
-        engine.init_vectorstore_table(
-            table_name=collection_name,
-            vector_size=VECTOR_SIZE,
-            id_column=Column("langchain_id", "VARCHAR"),
-        )
-        vector_store = AlloyDBVectorStore.create_sync(
-            engine,
-            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
-            table_name=collection_name,
-        )
         migrate_pgvector_collection(
             engine,
             collection_name=collection_name,
-            vector_store=vector_store,
+            vector_store=sync_vector_store,
             delete_pg_collection=True,
         )
 
-        # Check that all data has been migrated
-        migrated_table_count = await afetch(
-            engine, f"SELECT COUNT(*) FROM {collection_name}"
+        counts, migrated_data = await _afetch_migration_results(
+            engine,
+            collection_name,
+            SYNC_MIGRATED_TABLE,
+            "langchain_id, content, embedding, langchain_metadata",
         )
-        assert migrated_table_count == [{"count": 5}]
+
+        # Check that all data has been migrated, and that the collection data
+        # was deleted from both PGVector tables
+        assert counts == [{"migrated": 5, "embeddings": 0, "collections": 0}]
 
         # Check one row to ensure that the data is inserted correctly
-        migrated_data = await afetch(
-            engine,
-            f"SELECT langchain_id, content, embedding, langchain_metadata FROM {collection_name} LIMIT 1",
-        )
         expected_row = {
             "langchain_id": f"uuid_0_{collection_name}",
             "content": "content_0",
-            "embedding": str(sample_embeddings).replace(" ", ""),
+            "embedding": SAMPLE_EMBEDDINGS_STR,
             "langchain_metadata": self._create_metadata_for_collection(
                 collection_name, 0, num_cols=3
             ),
         }
-        assert expected_row in migrated_data
+        assert migrated_data == [expected_row]
 
-        # The collection data should be deleted from both PGVector tables
-        collection_id = f"collection_id_{collection_name}"
-        embeddings_table_count = await afetch(
-            engine,
-            EMBEDDINGS_TABLE_COUNT_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert embeddings_table_count == [{"count": 0}]
-        collection_table_entry = await afetch(
-            engine,
-            COLLECTION_TABLE_ENTRY_QUERY,
-            params={"collection_id": collection_id},
-        )
-        assert collection_table_entry == [{"count": 0}]
-
-        # Delete set up tables
-        await self._clean_tables(engine)
-        await aexecute(engine, f"DROP TABLE {collection_name}")
-
-    async def test_migrate_pgvector_collection_batch(self, engine, sample_embeddings):
+    async def test_migrate_pgvector_collection_batch(
+        self, engine, sample_embeddings, sync_vector_store
+    ):
         # Set up tables
         await self._create_pgvector_tables(engine, sample_embeddings, num_rows=7)
         collection_name = f"collection_0_{COLLECTION_NAME_SUFFIX}"
-        engine.init_vectorstore_table(
-            table_name=collection_name,
-            vector_size=VECTOR_SIZE,
-            id_column=Column("langchain_id", "VARCHAR"),
-        )
-        vector_store = AlloyDBVectorStore.create_sync(
-            table_name=collection_name,
-            engine=engine,
-            embedding_service=FakeEmbeddings(size=VECTOR_SIZE),
-        )
         migrate_pgvector_collection(
             engine,
             collection_name=collection_name,
-            vector_store=vector_store,
+            vector_store=sync_vector_store,
             insert_batch_size=5,
         )
 
         # Check that all data has been migrated
         migrated_table_count = await afetch(
-            engine, f"SELECT COUNT(*) FROM {collection_name}"
+            engine, f"SELECT COUNT(*) FROM {SYNC_MIGRATED_TABLE}"
         )
         assert migrated_table_count == [{"count": 7}]
 
         # Check last row to ensure that the data is inserted correctly
         migrated_data = await afetch(
             engine,
-            f"SELECT langchain_id, content, embedding, langchain_metadata FROM {collection_name}",
+            f"SELECT langchain_id, content, embedding, langchain_metadata FROM {SYNC_MIGRATED_TABLE} WHERE langchain_id = :id",
+            params={"id": f"uuid_6_{collection_name}"},
         )
         expected_row = {
             "langchain_id": f"uuid_6_{collection_name}",
             "content": "content_6",
-            "embedding": str(sample_embeddings).replace(" ", ""),
+            "embedding": SAMPLE_EMBEDDINGS_STR,
             "langchain_metadata": self._create_metadata_for_collection(
                 collection_name, 6, num_cols=3
             ),
         }
-        assert expected_row in migrated_data
-
-        # Delete set up tables
-        await self._clean_tables(engine)
-        await aexecute(engine, f"DROP TABLE {collection_name}")
+        assert migrated_data == [expected_row]
 
     async def test_list_pgvector_collection_names(self, engine, sample_embeddings):
         num_collections = 3
@@ -873,24 +758,27 @@ class TestPgvectorengine:
         all_collections = list_pgvector_collection_names(engine)
         assert len(all_collections) == num_collections
 
-        expected = [
+        expected = {
             f"collection_{i}_{COLLECTION_NAME_SUFFIX}" for i in range(num_collections)
-        ]
-        for collection in all_collections:
-            assert collection in expected
-
-        await self._clean_tables(engine)
+        }
+        assert set(all_collections) == expected
 
     async def test_list_pgvector_collection_names_error(self, engine):
-        await aexecute(engine, f"DROP TABLE IF EXISTS {EMBEDDINGS_TABLE}")
-        await aexecute(engine, f"DROP TABLE IF EXISTS {COLLECTIONS_TABLE}")
-        with pytest.raises(ValueError):
-            list_pgvector_collection_names(engine)
         await aexecute(
-            engine,
-            query=f"CREATE table {COLLECTIONS_TABLE} (uuid VARCHAR, name VARCHAR, cmetadata JSONB)",
+            engine, f"DROP TABLE IF EXISTS {COLLECTIONS_TABLE}, {EMBEDDINGS_TABLE}"
         )
-        await aexecute(
+        with pytest.raises(ValueError):
+            list_pgvector_collection_names(engine)
+        await aexecute_many(
             engine,
-            query=f"CREATE table {EMBEDDINGS_TABLE} (id VARCHAR, collection_id VARCHAR, embedding vector(768), document TEXT, cmetadata JSONB)",
+            [
+                (
+                    f"CREATE table {COLLECTIONS_TABLE} (uuid VARCHAR, name VARCHAR, cmetadata JSONB)",
+                    None,
+                ),
+                (
+                    f"CREATE table {EMBEDDINGS_TABLE} (id VARCHAR, collection_id VARCHAR, embedding vector(768), document TEXT, cmetadata JSONB)",
+                    None,
+                ),
+            ],
         )